@@ -1,12 +1,10 @@
 import concurrent.futures
 import json
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 import fsspec
-import trimesh
 import zarr
 from fsspec import AbstractFileSystem
-from trimesh.parent import Geometry
 
 from copick.impl.overlay import (
     CopickFeaturesOverlay,
@@ -22,6 +20,7 @@ from copick.models import (
     CopickConfig,
     CopickFeaturesMeta,
     CopickMeshMeta,
+    CopickPicksArray,
     CopickPicksFile,
     CopickRoot,
     CopickRunMeta,
@@ -34,6 +33,45 @@ from copick.models import (
     TCopickVoxelSpacing,
 )
 
+if TYPE_CHECKING:
+    from trimesh.parent import Geometry
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON indented by 4 spaces. Always uses the stdlib, so that files are written identically on every
+    install and non-finite scores are kept as `NaN`/`Infinity`."""
+    return json.dumps(obj, indent=4).encode()
+
+
+def _ls(fs: AbstractFileSystem, path: str) -> Dict[str, str]:
+    """List a directory as a mapping of entry names to entry types ("file" or "directory"). Symbolic links are reported
+    with the type of their target. Returns an empty mapping if the directory does not exist."""
+    try:
+        entries = fs.ls(path, detail=True)
+    except FileNotFoundError:
+        return {}
+
+    listing = {}
+    for e in entries:
+        kind = e["type"]
+        if e.get("islink") or kind not in ("file", "directory"):
+            kind = "directory" if fs.isdir(e["name"]) else "file"
+        listing[e["name"].rstrip("/").rsplit("/", 1)[-1]] = kind
+
+    return listing
+
+
+def _ls_run(fs: AbstractFileSystem, path: str) -> Dict[str, Dict[str, str]]:
+    """List a run directory and its Picks, Meshes and Segmentations folders, keyed by folder ("" for the run
+    directory itself)."""
+    listing = {"": _ls(fs, path), "Picks": {}, "Meshes": {}, "Segmentations": {}}
+    folders = [f for f in ("Picks", "Meshes", "Segmentations") if listing[""].get(f) == "directory"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        listing.update(zip(folders, executor.map(lambda f: _ls(fs, f"{path}/{f}"), folders)))
+
+    return listing
+
 
 class CopickConfigFSSpec(CopickConfig):
     """Copick configuration for fsspec-based storage.
@@ -46,7 +84,7 @@ class CopickConfigFSSpec(CopickConfig):
     """
 
     overlay_root: str
-    static_root: Optional[str]
+    static_root: Optional[str] = None
 
     overlay_fs_args: Optional[Dict[str, Any]] = {}
     static_fs_args: Optional[Dict[str, Any]] = {}
@@ -83,17 +121,26 @@ class CopickPicksFSSpec(CopickPicksOverlay):
         if not self.fs.exists(self.path):
             raise FileNotFoundError(f"File not found: {self.path}")
 
-        with self.fs.open(self.path, "r") as f:
-            data = json.load(f)
+        with self.fs.open(self.path, "rb") as f:
+            data = f.read()
+
+        return CopickPicksFile.model_validate_json(data)
+
+    def _load_numpy(self) -> CopickPicksArray:
+        if not self.fs.exists(self.path):
+            raise FileNotFoundError(f"File not found: {self.path}")
+
+        with self.fs.open(self.path, "rb") as f:
+            data = f.read()
 
-        return CopickPicksFile(**data)
+        return CopickPicksArray.from_dicts(json.loads(data).get("points") or [])
 
     def _store(self) -> None:
         if not self.fs.exists(self.directory):
             self.fs.makedirs(self.directory, exist_ok=True)
 
-        with self.fs.open(self.path, "w") as f:
-            json.dump(self.meta.dict(), f, indent=4)
+        with self.fs.open(self.path, "wb") as f:
+            f.write(_dumps(self.meta.model_dump()))
 
 
 class CopickMeshFSSpec(CopickMeshOverlay):
@@ -105,6 +152,8 @@ class CopickMeshFSSpec(CopickMeshOverlay):
         fs (AbstractFileSystem): The filesystem containing the mesh file.
     """
 
+    __slots__ = ()
+
     @property
     def path(self) -> str:
         if self.read_only:
@@ -123,7 +172,9 @@ class CopickMeshFSSpec(CopickMeshOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.run.fs_static if self.read_only else self.run.fs_overlay
 
-    def _load(self) -> Geometry:
+    def _load(self) -> "Geometry":
+        import trimesh
+
         if not self.fs.exists(self.path):
             raise FileNotFoundError(f"File not found: {self.path}")
 
@@ -149,6 +200,8 @@ class CopickSegmentationFSSpec(CopickSegmentationOverlay):
         fs (AbstractFileSystem): The filesystem containing the segmentation file.
     """
 
+    __slots__ = ()
+
     @property
     def filename(self) -> str:
         if self.is_multilabel:
@@ -167,8 +220,8 @@ class CopickSegmentationFSSpec(CopickSegmentationOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.run.fs_static if self.read_only else self.run.fs_overlay
 
-    def zarr(self) -> zarr.storage.FSStore:
-        """Get the zarr store for the segmentation object.
+    def _open_zarr(self) -> zarr.storage.FSStore:
+        """Open the zarr store for the segmentation object.
 
         Returns:
             zarr.storage.FSStore: The zarr store for the segmentation object.
@@ -198,6 +251,8 @@ class CopickFeaturesFSSpec(CopickFeaturesOverlay):
         fs (AbstractFileSystem): The filesystem containing the features file.
     """
 
+    __slots__ = ()
+
     @property
     def path(self) -> str:
         if self.read_only:
@@ -209,8 +264,8 @@ class CopickFeaturesFSSpec(CopickFeaturesOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.tomogram.fs_static if self.read_only else self.tomogram.fs_overlay
 
-    def zarr(self) -> zarr.storage.FSStore:
-        """Get the zarr store for the features object.
+    def _open_zarr(self) -> zarr.storage.FSStore:
+        """Open the zarr store for the features object.
 
         Returns:
             zarr.storage.FSStore: The zarr store for the features object.
@@ -245,6 +300,8 @@ class CopickTomogramFSSpec(CopickTomogramOverlay):
         static_is_overlay (bool): Whether the static and overlay sources are the same.
     """
 
+    __slots__ = ()
+
     def _feature_factory(self) -> Tuple[Type[TCopickFeatures], Type["CopickFeaturesMeta"]]:
         return CopickFeaturesFSSpec, CopickFeaturesMeta
 
@@ -323,8 +380,8 @@ class CopickTomogramFSSpec(CopickTomogramOverlay):
             for ft in feature_types
         ]
 
-    def zarr(self) -> zarr.storage.FSStore:
-        """Get the zarr store for the tomogram object.
+    def _open_zarr(self) -> zarr.storage.FSStore:
+        """Open the zarr store for the tomogram object.
 
         Returns:
             zarr.storage.FSStore: The zarr store for the tomogram object.
@@ -464,6 +521,8 @@ class CopickRunFSSpec(CopickRunOverlay):
         static_is_overlay (bool): Whether the static and overlay sources are the same.
     """
 
+    __slots__ = ()
+
     def _voxel_spacing_factory(self) -> Tuple[Type[TCopickVoxelSpacing], Type["CopickVoxelSpacingMeta"]]:
         return CopickVoxelSpacingFSSpec, CopickVoxelSpacingMeta
 
@@ -496,16 +555,40 @@ class CopickRunFSSpec(CopickRunOverlay):
     def static_is_overlay(self):
         return self.fs_static == self.fs_overlay and self.static_path == self.overlay_path
 
-    def query_voxelspacings(self) -> List[CopickVoxelSpacingFSSpec]:
-        static_vs_loc = f"{self.static_path}/VoxelSpacing"
-        spaths = self.fs_static.glob(static_vs_loc + "*") + self.fs_static.glob(static_vs_loc + "*/")
-        spaths = [p.rstrip("/") for p in spaths]
-        sspacings = [float(p.replace(f"{static_vs_loc}", "")) for p in spaths]
+    def _query_manifest(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """List the run directory and its Picks, Meshes and Segmentations folders on both sources at once.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, str]]]: Listings of the "static" and "overlay" source (see `_ls_run`).
+        """
+        if self.static_is_overlay:
+            return {"static": {}, "overlay": _ls_run(self.fs_overlay, self.overlay_path)}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            static = executor.submit(_ls_run, self.fs_static, self.static_path)
+            overlay = executor.submit(_ls_run, self.fs_overlay, self.overlay_path)
+            return {"static": static.result(), "overlay": overlay.result()}
+
+    def _list(self, static: bool, folder: str) -> Dict[str, str]:
+        """List a folder of the run on the static or overlay source, using the manifest during `refresh()`.
+
+        Args:
+            static: Whether to list the static or the overlay source.
+            folder: Folder relative to the run directory, "" for the run directory itself.
+
+        Returns:
+            Dict[str, str]: Mapping of entry names to entry types ("file" or "directory").
+        """
+        if self._manifest is not None:
+            return self._manifest["static" if static else "overlay"].get(folder, {})
 
-        overlay_vs_loc = f"{self.overlay_path}/VoxelSpacing"
-        opaths = self.fs_overlay.glob(overlay_vs_loc + "*") + self.fs_overlay.glob(overlay_vs_loc + "*/")
-        opaths = [p.rstrip("/") for p in opaths]
-        ospacings = [float(p.replace(f"{overlay_vs_loc}", "")) for p in opaths]
+        fs, path = (self.fs_static, self.static_path) if static else (self.fs_overlay, self.overlay_path)
+        return _ls(fs, f"{path}/{folder}" if folder else path)
+
+    def query_voxelspacings(self) -> List[CopickVoxelSpacingFSSpec]:
+        prefix = "VoxelSpacing"
+        sspacings = [float(n[len(prefix) :]) for n in self._list(True, "") if n.startswith(prefix)]
+        ospacings = [float(n[len(prefix) :]) for n in self._list(False, "") if n.startswith(prefix)]
 
         spacings = list(set(sspacings + ospacings))
 
@@ -521,9 +604,9 @@ class CopickRunFSSpec(CopickRunOverlay):
         if self.static_is_overlay:
             return []
 
-        pick_loc = f"{self.static_path}/Picks/"
-        paths = self.fs_static.glob(pick_loc + "*.json")
-        names = [n.replace(pick_loc, "").replace(".json", "") for n in paths]
+        names = [
+            n[: -len(".json")] for n, t in self._list(True, "Picks").items() if t == "file" and n.endswith(".json")
+        ]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -548,9 +631,9 @@ class CopickRunFSSpec(CopickRunOverlay):
         ]
 
     def _query_overlay_picks(self) -> List[CopickPicksFSSpec]:
-        pick_loc = f"{self.overlay_path}/Picks/"
-        paths = self.fs_overlay.glob(pick_loc + "*.json")
-        names = [n.replace(pick_loc, "").replace(".json", "") for n in paths]
+        names = [
+            n[: -len(".json")] for n, t in self._list(False, "Picks").items() if t == "file" and n.endswith(".json")
+        ]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -578,9 +661,7 @@ class CopickRunFSSpec(CopickRunOverlay):
         if self.static_is_overlay:
             return []
 
-        mesh_loc = f"{self.static_path}/Meshes/"
-        paths = self.fs_static.glob(mesh_loc + "*.glb")
-        names = [n.replace(mesh_loc, "").replace(".glb", "") for n in paths]
+        names = [n[: -len(".glb")] for n, t in self._list(True, "Meshes").items() if t == "file" and n.endswith(".glb")]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -605,9 +686,9 @@ class CopickRunFSSpec(CopickRunOverlay):
         ]
 
     def _query_overlay_meshes(self) -> List[CopickMeshFSSpec]:
-        mesh_loc = f"{self.overlay_path}/Meshes/"
-        paths = self.fs_overlay.glob(mesh_loc + "*.glb")
-        names = [n.replace(mesh_loc, "").replace(".glb", "") for n in paths]
+        names = [
+            n[: -len(".glb")] for n, t in self._list(False, "Meshes").items() if t == "file" and n.endswith(".glb")
+        ]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -631,14 +712,40 @@ class CopickRunFSSpec(CopickRunOverlay):
             for u, s, o in zip(users, sessions, objects)  # , strict=True)
         ]
 
+    def _store_picks(self, picks: List[CopickPicksFSSpec]) -> None:
+        """Store several picks in the overlay filesystem, writing all files in a single batch."""
+        if any(p.read_only for p in picks):
+            raise PermissionError("Cannot store picks in a read-only source.")
+
+        if not picks:
+            return
+
+        directory = picks[0].directory
+        if not self.fs_overlay.exists(directory):
+            self.fs_overlay.makedirs(directory, exist_ok=True)
+
+        self.fs_overlay.pipe({p.path: _dumps(p.meta.model_dump()) for p in picks})
+
+    def _store_meshes(self, meshes: List[CopickMeshFSSpec]) -> None:
+        """Store several meshes in the overlay filesystem, writing all files in a single batch."""
+        if any(m.read_only for m in meshes):
+            raise PermissionError("Cannot store mesh in a read-only source.")
+
+        if not meshes:
+            return
+
+        directory = meshes[0].directory
+        if not self.fs_overlay.exists(directory):
+            self.fs_overlay.makedirs(directory, exist_ok=True)
+
+        self.fs_overlay.pipe({m.path: m.mesh.export(file_type="glb") for m in meshes})
+
     def _query_static_segmentations(self) -> List[CopickSegmentationFSSpec]:
         if self.static_is_overlay:
             return []
 
-        seg_loc = f"{self.static_path}/Segmentations/"
-        paths = self.fs_static.glob(seg_loc + "*.zarr") + self.fs_static.glob(seg_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_static.isdir(p)]
-        names = [n.replace(seg_loc, "").replace(".zarr", "") for n in paths]
+        entries = self._list(True, "Segmentations")
+        names = [n[: -len(".zarr")] for n, t in entries.items() if t == "directory" and n.endswith(".zarr")]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -681,10 +788,8 @@ class CopickRunFSSpec(CopickRunOverlay):
         ]
 
     def _query_overlay_segmentations(self) -> List[CopickSegmentationFSSpec]:
-        seg_loc = f"{self.overlay_path}/Segmentations/"
-        paths = self.fs_overlay.glob(seg_loc + "*.zarr") + self.fs_overlay.glob(seg_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_overlay.isdir(p)]
-        names = [n.replace(seg_loc, "").replace(".zarr", "") for n in paths]
+        entries = self._list(False, "Segmentations")
+        names = [n[: -len(".zarr")] for n, t in entries.items() if t == "directory" and n.endswith(".zarr")]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
 
@@ -761,6 +866,8 @@ class CopickObjectFSSpec(CopickObjectOverlay):
         fs (AbstractFileSystem): The filesystem containing the object file.
     """
 
+    __slots__ = ()
+
     @property
     def path(self):
         return f"{self.root.root_static}/Objects/{self.name}.zarr"
@@ -769,15 +876,12 @@ class CopickObjectFSSpec(CopickObjectOverlay):
     def fs(self):
         return self.root.fs_static
 
-    def zarr(self) -> Union[None, zarr.storage.FSStore]:
-        """Get the zarr store for the object.
+    def _open_zarr(self) -> zarr.storage.FSStore:
+        """Open the zarr store for the object.
 
         Returns:
-            Union[None, zarr.storage.FSStore]: The zarr store for the object, or None if the object is not a particle.
+            zarr.storage.FSStore: The zarr store for the object.
         """
-        if not self.is_particle:
-            return None
-
         if self.read_only:
             mode = "r"
             create = False
@@ -805,6 +909,8 @@ class CopickRootFSSpec(CopickRoot):
         root_static (Optional[str]): The root path for the static storage.
     """
 
+    __slots__ = ("fs_overlay", "fs_static", "root_overlay", "root_static")
+
     def __init__(self, config: CopickConfigFSSpec):
         """
         Args:
@@ -839,10 +945,7 @@ class CopickRootFSSpec(CopickRoot):
         Returns:
             CopickRootFSSpec: The initialized CopickRootFSSpec object.
         """
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        return cls(CopickConfigFSSpec(**data))
+        return cls(CopickConfigFSSpec.from_file(path))
 
     def _run_factory(self) -> Tuple[Type[TCopickRun], Type["CopickRunMeta"]]:
         return CopickRunFSSpec, CopickRunMeta
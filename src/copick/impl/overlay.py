@@ -1,6 +1,4 @@
-from typing import List, Optional
-
-from trimesh.parent import Geometry
+from typing import TYPE_CHECKING, List, Optional
 
 from copick.models import (
     CopickFeatures,
@@ -20,6 +18,9 @@ from copick.models import (
     PickableObject,
 )
 
+if TYPE_CHECKING:
+    from trimesh.parent import Geometry
+
 
 class CopickPicksOverlay(CopickPicks):
     """CopickPicks class that keeps track of whether the picks are read-only.
@@ -46,7 +47,15 @@ class CopickMeshOverlay(CopickMesh):
         read_only (bool): Whether the mesh is read-only.
     """
 
-    def __init__(self, run: CopickRun, meta: CopickMeshMeta, mesh: Optional[Geometry] = None, read_only: bool = False):
+    __slots__ = ("read_only",)
+
+    def __init__(
+        self,
+        run: CopickRun,
+        meta: CopickMeshMeta,
+        mesh: Optional["Geometry"] = None,
+        read_only: bool = False,
+    ):
         super().__init__(run, meta, mesh)
         self.read_only = read_only
 
@@ -64,6 +73,8 @@ class CopickSegmentationOverlay(CopickSegmentation):
         read_only (bool): Whether the segmentation is read-only.
     """
 
+    __slots__ = ("read_only",)
+
     def __init__(self, run: CopickRun, meta: CopickSegmentationMeta, read_only: bool = False):
         super().__init__(run, meta)
         self.read_only = read_only
@@ -76,6 +87,8 @@ class CopickObjectOverlay(CopickObject):
         read_only (bool): Whether the object is read-only.
     """
 
+    __slots__ = ("read_only",)
+
     def __init__(self, root: CopickRoot, meta: PickableObject, read_only: bool = True):
         super().__init__(root, meta)
         self.read_only = read_only
@@ -86,6 +99,8 @@ class CopickRunOverlay(CopickRun):
     and the second location is writable (overlay).
     """
 
+    __slots__ = ()
+
     def _query_static_picks(self) -> List[CopickPicksOverlay]:
         """Override to query the static source for the picks. All returned picks must be read-only.
 
@@ -184,6 +199,8 @@ class CopickFeaturesOverlay(CopickFeatures):
         read_only (bool): Whether the features are read-only.
     """
 
+    __slots__ = ("read_only",)
+
     def __init__(self, tomogram: CopickTomogram, meta: CopickFeaturesMeta, read_only: bool = False):
         super().__init__(tomogram, meta)
         self.read_only = read_only
@@ -197,6 +214,8 @@ class CopickTomogramOverlay(CopickTomogram):
         read_only (bool): Whether the tomogram is read-only.
     """
 
+    __slots__ = ("read_only",)
+
     def __init__(self, voxel_spacing: CopickVoxelSpacing, meta: CopickTomogramMeta, read_only: bool = False, **kwargs):
         super().__init__(voxel_spacing, meta, **kwargs)
         self.read_only = read_only
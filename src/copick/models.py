@@ -1,20 +1,31 @@
-import json
-from typing import Dict, List, Literal, MutableMapping, Optional, Tuple, Type, TypeVar, Union
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_serializer, field_validator
 
-# Should work with pydantic 1 and 2
-import pydantic
-import trimesh
-
-if pydantic.VERSION.startswith("1"):
-    from pydantic import BaseModel, validator
-elif pydantic.VERSION.startswith("2"):
-    from pydantic.v1 import BaseModel, validator
-else:
-    raise ImportError(f"Unsupported pydantic version {pydantic.VERSION}.")
-
-from trimesh.parent import Geometry
+if TYPE_CHECKING:
+    from trimesh.parent import Geometry
 
 TPickableObject = TypeVar("TPickableObject", bound="PickableObject")
 TCopickConfig = TypeVar("TCopickConfig", bound="CopickConfig")
@@ -30,6 +41,15 @@ TCopickRun = TypeVar("TCopickRun", bound="CopickRun")
 TCopickObject = TypeVar("TCopickObject", bound="CopickObject")
 TCopickRoot = TypeVar("TCopickRoot", bound="CopickRoot")
 
+_ColorChannel = Annotated[int, Field(ge=0, le=255)]
+"""A single 8-bit color channel."""
+
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+"""String that is interned on validation, for identifiers that repeat across many entities."""
+
+_refresh_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="copick-refresh")
+"""Executor for background refreshes started by `CopickRun.refresh_async`."""
+
 
 class PickableObject(BaseModel):
     """Metadata for a pickable objects.
@@ -45,26 +65,23 @@ class PickableObject(BaseModel):
         radius: Radius of the particle, when displaying as a sphere.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     is_particle: bool
-    label: Optional[int]
-    color: Optional[Tuple[int, int, int, int]]
+    label: Optional[int] = None
+    color: Optional[Tuple[_ColorChannel, _ColorChannel, _ColorChannel, _ColorChannel]] = None
     emdb_id: Optional[str] = None
     pdb_id: Optional[str] = None
     map_threshold: Optional[float] = None
     radius: Optional[float] = None
 
-    @validator("label")
+    @field_validator("label")
+    @classmethod
     def validate_label(cls, v) -> int:
         """Validate the label."""
-        assert v != 0, "Label 0 is reserved for background."
-        return v
-
-    @validator("color")
-    def validate_color(cls, v) -> Tuple[int, int, int, int]:
-        """Validate the color."""
-        assert len(v) == 4, "Color must be a 4-tuple (RGBA)."
-        assert all(0 <= c <= 255 for c in v), "Color values must be in the range [0, 255]."
+        if v == 0:
+            raise ValueError("Label 0 is reserved for background.")
         return v
 
 
@@ -105,12 +122,19 @@ class CopickConfig(BaseModel):
             CopickConfig: Initialized CopickConfig object
 
         """
-        with open(filename) as f:
-            return cls(**json.load(f))
+        st = os.stat(filename)
+        return cls.model_validate_json(_load_config_raw(os.fspath(filename), st.st_mtime_ns, st.st_size))
 
 
-class CopickLocation(BaseModel):
-    """Location in 3D space.
+@lru_cache(maxsize=8)
+def _load_config_raw(filename: str, mtime_ns: int, size: int) -> bytes:
+    """Read a config file. Cached per file, modification time and size, so edits to the file invalidate the entry."""
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+class CopickLocation(NamedTuple):
+    """Location in 3D space. Stored as a plain tuple, serialized as `{"x": ..., "y": ..., "z": ...}`.
 
     Attributes:
         x: x-coordinate.
@@ -123,6 +147,28 @@ class CopickLocation(BaseModel):
     z: float
 
 
+def _validate_4x4(v: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+    """Check that v is a 4x4 homogeneous transformation matrix, i.e. its last row is exactly [0, 0, 0, 1].
+
+    Args:
+        v: Matrix to validate.
+
+    Returns:
+        np.ndarray: The matrix as a float64 array.
+
+    Raises:
+        ValueError: If the matrix is not a 4x4 homogeneous transformation matrix.
+    """
+    arr = np.asarray(v, dtype=np.float64)
+    if arr.shape != (4, 4):
+        raise ValueError("Transformation must be a 4x4 matrix.")
+    if arr[3, 3] != 1.0:
+        raise ValueError("Last element of transformation matrix must be 1.0.")
+    if arr[3, 0] != 0.0 or arr[3, 1] != 0.0 or arr[3, 2] != 0.0:
+        raise ValueError("Last row of transformation matrix must be [0, 0, 0, 1].")
+    return arr
+
+
 class CopickPoint(BaseModel):
     """Point in 3D space with an associated orientation, score value and instance ID.
 
@@ -133,7 +179,7 @@ class CopickPoint(BaseModel):
         score: Score value.
     """
 
-    location: TCopickLocation
+    location: CopickLocation
     transformation_: Optional[List[List[float]]] = [
         [1.0, 0.0, 0.0, 0.0],
         [0.0, 1.0, 0.0, 0.0],
@@ -143,16 +189,18 @@ class CopickPoint(BaseModel):
     instance_id: Optional[int] = 0
     score: Optional[float] = 1.0
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @field_serializer("location")
+    def serialize_location(self, v: CopickLocation) -> Dict[str, Any]:
+        """Serialize the location as a mapping of coordinates."""
+        return v._asdict()
 
-    @validator("transformation_")
+    @field_validator("transformation_")
+    @classmethod
     def validate_transformation(cls, v) -> List[List[float]]:
         """Validate the transformation matrix."""
-        arr = np.array(v)
-        assert arr.shape == (4, 4), "transformation must be a 4x4 matrix."
-        assert arr[3, 3] == 1.0, "Last element of transformation matrix must be 1.0."
-        assert np.allclose(arr[3, :], [0.0, 0.0, 0.0, 1.0]), "Last row of transformation matrix must be [0, 0, 0, 1]."
+        _validate_4x4(v)
         return v
 
     @property
@@ -162,15 +210,24 @@ class CopickPoint(BaseModel):
         Returns:
             np.ndarray: 4x4 transformation matrix.
         """
-        return np.array(self.transformation_)
+        return np.array(self.transformation_, dtype=np.float64)
+
+    @classmethod
+    def _from_row(cls, arr: "CopickPicksArray", i: int) -> TCopickPoint:
+        """Create a point from row i of a CopickPicksArray without re-validating it. The point holds copies of the row,
+        so later changes to the array do not affect it."""
+        x, y, z = arr.locations[i].tolist()
+        return cls.model_construct(
+            location=CopickLocation(x, y, z),
+            transformation_=arr.transforms[i].tolist(),
+            instance_id=int(arr.instance_ids[i]),
+            score=float(arr.scores[i]),
+        )
 
     @transformation.setter
     def transformation(self, value: np.ndarray) -> None:
         """Set the transformation matrix."""
-        assert value.shape == (4, 4), "Transformation must be a 4x4 matrix."
-        assert value[3, 3] == 1.0, "Last element of transformation matrix must be 1.0."
-        assert np.allclose(value[3, :], [0.0, 0.0, 0.0, 1.0]), "Last row of transformation matrix must be [0, 0, 0, 1]."
-        self.transformation_ = value.tolist()
+        self.transformation_ = _validate_4x4(value).tolist()
 
 
 class CopickObject:
@@ -189,6 +246,8 @@ class CopickObject:
         radius: Radius of the particle, when displaying as a sphere.
     """
 
+    __slots__ = ("meta", "root", "_zarr_store")
+
     def __init__(self, root: TCopickRoot, meta: PickableObject):
         """
         Args:
@@ -198,6 +257,8 @@ class CopickObject:
 
         self.meta = meta
         self.root = root
+        self._zarr_store: Optional[MutableMapping] = None
+        """Zarr store opened by CopickObject.zarr, reused until CopickObject.invalidate_zarr is called."""
 
     def __repr__(self):
         label = self.label if self.label is not None else "None"
@@ -244,13 +305,29 @@ class CopickObject:
     def radius(self) -> Union[float, None]:
         return self.meta.radius
 
+    def _open_zarr(self) -> MutableMapping:
+        """Override this method to open the zarr store for this object. Only called if CopickObject.is_particle is
+        True."""
+        raise NotImplementedError("_open_zarr method must be implemented for particle objects.")
+
     def zarr(self) -> Union[None, MutableMapping]:
-        """Override this method to return a zarr store for this object. Should return None if
-        CopickObject.is_particle is False."""
+        """Get the zarr store for this object. The store is opened once and reused until
+        `CopickObject.invalidate_zarr` is called.
+
+        Returns:
+            Union[None, MutableMapping]: The zarr store for this object, or None if the object is not a particle.
+        """
         if not self.is_particle:
             return None
 
-        raise NotImplementedError("zarr method must be implemented for particle objects.")
+        if self._zarr_store is None:
+            self._zarr_store = self._open_zarr()
+
+        return self._zarr_store
+
+    def invalidate_zarr(self) -> None:
+        """Drop the cached zarr store, so the next call to `CopickObject.zarr` opens it again."""
+        self._zarr_store = None
 
 
 class CopickRoot:
@@ -265,6 +342,8 @@ class CopickRoot:
 
     """
 
+    __slots__ = ("config", "_runs", "_runs_by_name", "_runs_from_config", "_objects", "_objects_by_name")
+
     def __init__(self, config: TCopickConfig):
         """
         Args:
@@ -272,11 +351,17 @@ class CopickRoot:
         """
         self.config = config
         self._runs: Optional[List[TCopickRun]] = None
+        self._runs_by_name: Dict[str, Optional[TCopickRun]] = {}
+        """Index of CopickRoot.runs by name, kept in sync with CopickRoot._runs. Runs listed in the config are None
+        until first accessed."""
+        self._runs_from_config = config.runs is not None
         self._objects: Optional[List[TCopickObject]] = None
+        self._objects_by_name: Dict[str, TCopickObject] = {}
+        """Index of CopickRoot.pickable_objects by name, kept in sync with CopickRoot._objects."""
 
-        # If runs are specified in the config, create them
-        if config.runs is not None:
-            self._runs = [CopickRun(self, CopickRunMeta(name=run_name)) for run_name in config.runs]
+        # If runs are specified in the config, register their names. The runs are constructed on first access.
+        if self._runs_from_config:
+            self._runs_by_name = dict.fromkeys(config.runs)
 
     def __repr__(self):
         lpo = None if self._objects is None else len(self._objects)
@@ -306,10 +391,23 @@ class CopickRoot:
     @property
     def runs(self) -> List[TCopickRun]:
         if self._runs is None:
-            self._runs = self.query()
+            if self._runs_from_config:
+                self._runs = [self._config_run(name) for name in list(self._runs_by_name)]
+            else:
+                self.refresh()
 
         return self._runs
 
+    def _config_run(self, name: str) -> TCopickRun:
+        """Get a run listed in the config, constructing it on first access."""
+        run = self._runs_by_name[name]
+        if run is None:
+            clz, meta_clz = self._run_factory()
+            run = clz(self, meta=meta_clz(name=name))
+            self._runs_by_name[name] = run
+
+        return run
+
     def get_run(self, name: str, **kwargs) -> Union[TCopickRun, None]:
         """Get run by name.
 
@@ -320,6 +418,12 @@ class CopickRoot:
         Returns:
             CopickRun: The run with the given name, or None if not found.
         """
+        # Runs listed in the config
+        if self._runs_from_config:
+            if name not in self._runs_by_name:
+                return None
+            return self._config_run(name)
+
         # Random access
         if self._runs is None:
             clz, meta_clz = self._run_factory()
@@ -333,17 +437,14 @@ class CopickRoot:
 
         # Access through index
         else:
-            for run in self.runs:
-                if run.name == name:
-                    return run
-
-        return None
+            return self._runs_by_name.get(name)
 
     @property
     def pickable_objects(self) -> List[TCopickObject]:
         if self._objects is None:
             clz, meta_clz = self._object_factory()
             self._objects = [clz(self, meta=obj) for obj in self.config.pickable_objects]
+            self._objects_by_name = {o.name: o for o in self._objects}
 
         return self._objects
 
@@ -356,15 +457,16 @@ class CopickRoot:
         Returns:
             CopickObject: The object with the given name, or None if not found.
         """
-        for obj in self.pickable_objects:
-            if obj.name == name:
-                return obj
+        if self._objects is None:
+            _ = self.pickable_objects
 
-        return None
+        return self._objects_by_name.get(name)
 
     def refresh(self) -> None:
         """Refresh the list of runs."""
+        self._runs_from_config = False
         self._runs = self.query()
+        self._runs_by_name = {r.name: r for r in self._runs}
 
     def new_run(self, name: str, **kwargs) -> TCopickRun:
         """Create a new run.
@@ -379,17 +481,20 @@ class CopickRoot:
         Raises:
             ValueError: If a run with the given name already exists.
         """
-        if name in [r.name for r in self.runs]:
+        if self._runs is None and not self._runs_from_config:
+            _ = self.runs
+
+        if name in self._runs_by_name:
             raise ValueError(f"Run name {name} already exists.")
 
         clz, meta_clz = self._run_factory()
         rm = meta_clz(name=name, **kwargs)
         run = clz(self, meta=rm)
 
-        # Append the run
-        if self._runs is None:
-            self._runs = []
-        self._runs.append(run)
+        # Append the run (config-listed runs that were not materialized yet only need the index)
+        if self._runs is not None:
+            self._runs.append(run)
+        self._runs_by_name[name] = run
 
         run.ensure(create=True)
 
@@ -411,9 +516,49 @@ class CopickRunMeta(BaseModel):
         name: Name of the run.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
 
 
+def _group_by(entities: List[Any], key: Callable[[Any], Any]) -> Dict[Any, List[Any]]:
+    """Group picks, meshes or segmentations by key(entity), preserving their order."""
+    groups = {}
+    for e in entities:
+        groups.setdefault(key(e), []).append(e)
+    return groups
+
+
+def _first_by(entities: List[Any], key: Callable[[Any], Any]) -> Dict[Any, Any]:
+    """Index tomograms or features by key(entity). If several share a key, the first one is kept."""
+    index = {}
+    for e in entities:
+        index.setdefault(key(e), e)
+    return index
+
+
+def _group_by_user(entities: List[Any]) -> Dict[str, List[Any]]:
+    """Group picks, meshes or segmentations by user_id, preserving their order."""
+    return _group_by(entities, lambda e: e.user_id)
+
+
+def _merge_created(listed: List[Any], created: List[Any], key: Callable[[Any], Any]) -> List[Any]:
+    """Add created entities that a listing of the storage backend may have missed to its result, unless the listing
+    found them."""
+    keys = {key(e) for e in listed}
+    return listed + [e for e in created if key(e) not in keys]
+
+
+def _picks_key(p: Any) -> Tuple[str, str, str]:
+    """Key of picks or meshes in CopickRun._picks_index and CopickRun._meshes_index."""
+    return p.pickable_object_name, p.user_id, p.session_id
+
+
+def _segmentation_key(s: Any) -> Tuple[str, str, str, float, bool]:
+    """Key of segmentations in CopickRun._segmentations_index."""
+    return s.name, s.user_id, s.session_id, s.voxel_size, s.is_multilabel
+
+
 class CopickRun:
     """Encapsulates all data pertaining to a physical location on a sample (i.e. typically one tilt series and the
     associated tomograms). This includes voxel spacings (of the reconstructed tomograms), picks, meshes, and
@@ -434,27 +579,108 @@ class CopickRun:
 
     """
 
+    __slots__ = (
+        "meta",
+        "root",
+        "_voxel_spacings",
+        "_vs_by_size",
+        "_picks",
+        "_picks_index",
+        "_tool_picks",
+        "_user_picks",
+        "_picks_by_user",
+        "_meshes",
+        "_meshes_index",
+        "_tool_meshes",
+        "_user_meshes",
+        "_meshes_by_user",
+        "_segmentations",
+        "_segmentations_index",
+        "_tool_segmentations",
+        "_user_segmentations",
+        "_segmentations_by_user",
+        "_manifest",
+        "refresh_ttl",
+        "last_refresh",
+        "_refresh_future",
+        "_refresh_started",
+        "_lock",
+        "_pending",
+        "_listings",
+    )
+
     def __init__(self, root: TCopickRoot, meta: CopickRunMeta, config: Optional[TCopickConfig] = None):
         self.meta = meta
         self.root = root
         self._voxel_spacings: Optional[List[TCopickVoxelSpacing]] = None
         """Voxel spacings for this run. Either populated from config or lazily loaded when CopickRun.voxel_spacings is
         accessed for the first time."""
+        self._vs_by_size: Dict[float, TCopickVoxelSpacing] = {}
+        """Index of CopickRun.voxel_spacings by voxel size, kept in sync with CopickRun._voxel_spacings."""
         self._picks: Optional[List[TCopickPicks]] = None
         """Picks for this run. Either populated from config or lazily loaded when CopickRun.picks is
         accessed for the first time."""
+        self._picks_index: Dict[Tuple[str, str, str], List[TCopickPicks]] = {}
+        """Index of CopickRun.picks by (object_name, user_id, session_id), kept in sync with CopickRun._picks. A key can
+        map to several picks, e.g. if the same file exists in the static and the overlay source."""
+        self._tool_picks: List[TCopickPicks] = []
+        self._user_picks: List[TCopickPicks] = []
+        """Partition of CopickRun.picks into tool and user picks, kept in sync with CopickRun._picks."""
+        self._picks_by_user: Dict[str, List[TCopickPicks]] = {}
+        """Index of CopickRun.picks by user_id, kept in sync with CopickRun._picks."""
         self._meshes: Optional[List[TCopickMesh]] = None
         """Meshes for this run. Either populated from config or lazily loaded when CopickRun.picks is
         accessed for the first time."""
+        self._meshes_index: Dict[Tuple[str, str, str], List[TCopickMesh]] = {}
+        """Index of CopickRun.meshes by (object_name, user_id, session_id), kept in sync with CopickRun._meshes. A key
+        can map to several meshes, e.g. if the same file exists in the static and the overlay source."""
+        self._tool_meshes: List[TCopickMesh] = []
+        self._user_meshes: List[TCopickMesh] = []
+        """Partition of CopickRun.meshes into tool and user meshes, kept in sync with CopickRun._meshes."""
+        self._meshes_by_user: Dict[str, List[TCopickMesh]] = {}
+        """Index of CopickRun.meshes by user_id, kept in sync with CopickRun._meshes."""
         self._segmentations: Optional[List[TCopickSegmentation]] = None
         """Segmentations for this run. Either populated from config or lazily loaded when
         CopickRun.segmentations is accessed for the first time."""
+        self._segmentations_index: Dict[Tuple[str, str, str, float, bool], List[TCopickSegmentation]] = {}
+        """Index of CopickRun.segmentations by (name, user_id, session_id, voxel_size, is_multilabel), kept in sync
+        with CopickRun._segmentations. A key can map to several segmentations, e.g. if the same store exists in the
+        static and the overlay source."""
+        self._tool_segmentations: List[TCopickSegmentation] = []
+        self._user_segmentations: List[TCopickSegmentation] = []
+        """Partition of CopickRun.segmentations into tool and user segmentations, kept in sync with
+        CopickRun._segmentations."""
+        self._segmentations_by_user: Dict[str, List[TCopickSegmentation]] = {}
+        """Index of CopickRun.segmentations by user_id, kept in sync with CopickRun._segmentations."""
+        self._manifest: Optional[Any] = None
+        """Listing of all child entities, only set while CopickRun.refresh is running."""
+        self.refresh_ttl: Optional[float] = None
+        """Maximum age in seconds of the cached child entities. Accessing them when they are older starts a background
+        refresh (see CopickRun.refresh_async), while the cached entities are returned. None disables this."""
+        self.last_refresh: Optional[float] = None
+        """Time (as returned by `time.time()`) at which child entities were last refreshed from storage."""
+        self._refresh_future: Optional[concurrent.futures.Future] = None
+        """Most recent background refresh started by CopickRun.refresh_async."""
+        self._refresh_started: float = 0.0
+        """Time at which the most recent background refresh was started."""
+        self._lock = threading.RLock()
+        """Serializes creating child entities with publishing refreshed ones."""
+        self._pending: Dict[str, List[List[Any]]] = {
+            "voxel_spacings": [],
+            "picks": [],
+            "meshes": [],
+            "segmentations": [],
+        }
+        """Child entities created on this run that no listing of the storage backend has confirmed yet, as
+        [entity, stamp] pairs per child type. stamp is None until the entity is stored and then the value of
+        CopickRun._listings at that time. A listing confirms the entity if it started after the entity was stored."""
+        self._listings: int = 0
+        """Number of listings of child entities started so far (see CopickRun._begin_listing)."""
 
         if config is not None:
-            voxel_spacings_metas = [
-                CopickVoxelSpacingMeta(run=self, voxel_size=vs, config=config) for vs in config.tomograms
-            ]
+            voxel_spacings_metas = [CopickVoxelSpacingMeta(voxel_size=vs) for vs in config.tomograms]
             self._voxel_spacings = [CopickVoxelSpacing(run=self, meta=vs) for vs in voxel_spacings_metas]
+            self._vs_by_size = {vs.voxel_size: vs for vs in self._voxel_spacings}
 
             #####################
             # Picks from config #
@@ -482,7 +708,11 @@ class CopickRun:
             ######################
             for object_name, tool_names in config.available_pre_meshes.items():
                 for mesh_tool in tool_names:
-                    mm = CopickMeshMeta(pickable_object_name=object_name, user_id=mesh_tool, session_id="0")
+                    mm = CopickMeshMeta(
+                        pickable_object_name=object_name,
+                        user_id=mesh_tool,
+                        session_id="0",
+                    )
                     com = CopickMesh(run=self, meta=mm)
                     self._meshes.append(com)
 
@@ -511,7 +741,12 @@ class CopickRun:
 
     @name.setter
     def name(self, value: str) -> None:
-        self.meta.name = value
+        # Keep the root's run index in sync, preserving the order of config-listed runs that are not constructed yet
+        old = self.meta.name
+        if self.root._runs_by_name.get(old) is self:
+            self.root._runs_by_name = {(value if k == old else k): r for k, r in self.root._runs_by_name.items()}
+
+        self.meta = self.meta.model_copy(update={"name": value})
 
     def query_voxelspacings(self) -> List[TCopickVoxelSpacing]:
         """Override this method to query for voxel_spacings.
@@ -548,7 +783,9 @@ class CopickRun:
     @property
     def voxel_spacings(self) -> List[TCopickVoxelSpacing]:
         if self._voxel_spacings is None:
-            self._voxel_spacings = self.query_voxelspacings()
+            self.refresh_voxel_spacings()
+        else:
+            self._revalidate()
 
         return self._voxel_spacings
 
@@ -575,16 +812,14 @@ class CopickRun:
 
         # Access through index
         else:
-            for vs in self.voxel_spacings:
-                if vs.voxel_size == voxel_size:
-                    return vs
-
-        return None
+            return self._vs_by_size.get(voxel_size)
 
     @property
     def picks(self) -> List[TCopickPicks]:
         if self._picks is None:
-            self._picks = self.query_picks()
+            self.refresh_picks()
+        else:
+            self._revalidate()
 
         return self._picks
 
@@ -594,10 +829,13 @@ class CopickRun:
         Returns:
             List[CopickPicks]: List of user-generated picks.
         """
+        if self._picks is None:
+            _ = self.picks
+
         if self.root.config.user_id is None:
-            return [p for p in self.picks if p.session_id != "0"]
+            return self._user_picks[:]
         else:
-            return self.get_picks(user_id=self.root.config.user_id)
+            return self._picks_by_user.get(self.root.config.user_id, [])[:]
 
     def tool_picks(self) -> List[TCopickPicks]:
         """Get all tool generated picks (i.e. picks that have `CopickPicks.session_id == 0`).
@@ -605,7 +843,10 @@ class CopickRun:
         Returns:
             List[CopickPicks]: List of tool-generated picks.
         """
-        return [p for p in self.picks if p.session_id == "0"]
+        if self._picks is None:
+            _ = self.picks
+
+        return self._tool_picks[:]
 
     def get_picks(self, object_name: str = None, user_id: str = None, session_id: str = None) -> List[TCopickPicks]:
         """Get picks by name, user_id or session_id (or combinations).
@@ -618,23 +859,43 @@ class CopickRun:
         Returns:
             List[CopickPicks]: List of picks that match the search criteria.
         """
-        ret = self.picks
+        if self._picks is None:
+            _ = self.picks
 
-        if object_name is not None:
-            ret = [p for p in ret if p.pickable_object_name == object_name]
+        # Fully specified query
+        if object_name is not None and user_id is not None and session_id is not None:
+            return self._picks_index.get((object_name, user_id, session_id), [])[:]
 
-        if user_id is not None:
-            ret = [p for p in ret if p.user_id == user_id]
+        candidates = self._picks if user_id is None else self._picks_by_user.get(user_id, [])
+        return [
+            p
+            for p in candidates
+            if (object_name is None or p.pickable_object_name == object_name)
+            and (session_id is None or p.session_id == session_id)
+        ]
 
-        if session_id is not None:
-            ret = [p for p in ret if p.session_id == session_id]
+    def has_picks(self, object_name: str, user_id: str, session_id: str) -> bool:
+        """Check whether picks for the given object, user_id and session_id exist, without building a list.
 
-        return ret
+        Args:
+            object_name: Name of the object.
+            user_id: User ID of the picks.
+            session_id: Session ID of the picks.
+
+        Returns:
+            bool: True if the picks exist.
+        """
+        if self._picks is None:
+            _ = self.picks
+
+        return (object_name, user_id, session_id) in self._picks_index
 
     @property
     def meshes(self) -> List[TCopickMesh]:
         if self._meshes is None:
-            self._meshes = self.query_meshes()
+            self.refresh_meshes()
+        else:
+            self._revalidate()
 
         return self._meshes
 
@@ -644,10 +905,13 @@ class CopickRun:
         Returns:
             List[CopickMesh]: List of user-generated meshes.
         """
+        if self._meshes is None:
+            _ = self.meshes
+
         if self.root.config.user_id is None:
-            return [m for m in self.meshes if m.session_id != "0"]
+            return self._user_meshes[:]
         else:
-            return self.get_meshes(user_id=self.root.config.user_id)
+            return self._meshes_by_user.get(self.root.config.user_id, [])[:]
 
     def tool_meshes(self) -> List[TCopickMesh]:
         """Get all tool generated meshes (i.e. meshes that have `CopickMesh.session_id == 0`).
@@ -655,7 +919,10 @@ class CopickRun:
         Returns:
             List[CopickMesh]: List of tool-generated meshes.
         """
-        return [m for m in self.meshes if m.session_id == "0"]
+        if self._meshes is None:
+            _ = self.meshes
+
+        return self._tool_meshes[:]
 
     def get_meshes(self, object_name: str = None, user_id: str = None, session_id: str = None) -> List[TCopickMesh]:
         """Get meshes by name, user_id or session_id (or combinations).
@@ -668,23 +935,43 @@ class CopickRun:
         Returns:
             List[CopickMesh]: List of meshes that match the search criteria.
         """
-        ret = self.meshes
+        if self._meshes is None:
+            _ = self.meshes
 
-        if object_name is not None:
-            ret = [m for m in ret if m.pickable_object_name == object_name]
+        # Fully specified query
+        if object_name is not None and user_id is not None and session_id is not None:
+            return self._meshes_index.get((object_name, user_id, session_id), [])[:]
 
-        if user_id is not None:
-            ret = [m for m in ret if m.user_id == user_id]
+        candidates = self._meshes if user_id is None else self._meshes_by_user.get(user_id, [])
+        return [
+            m
+            for m in candidates
+            if (object_name is None or m.pickable_object_name == object_name)
+            and (session_id is None or m.session_id == session_id)
+        ]
 
-        if session_id is not None:
-            ret = [m for m in ret if m.session_id == session_id]
+    def has_mesh(self, object_name: str, user_id: str, session_id: str) -> bool:
+        """Check whether a mesh for the given object, user_id and session_id exists, without building a list.
 
-        return ret
+        Args:
+            object_name: Name of the object.
+            user_id: User ID of the mesh.
+            session_id: Session ID of the mesh.
+
+        Returns:
+            bool: True if the mesh exists.
+        """
+        if self._meshes is None:
+            _ = self.meshes
+
+        return (object_name, user_id, session_id) in self._meshes_index
 
     @property
     def segmentations(self) -> List[TCopickSegmentation]:
         if self._segmentations is None:
-            self._segmentations = self.query_segmentations()
+            self.refresh_segmentations()
+        else:
+            self._revalidate()
 
         return self._segmentations
 
@@ -694,10 +981,13 @@ class CopickRun:
         Returns:
             List[CopickSegmentation]: List of user-generated segmentations.
         """
+        if self._segmentations is None:
+            _ = self.segmentations
+
         if self.root.config.user_id is None:
-            return [s for s in self.segmentations if s.session_id != "0"]
+            return self._user_segmentations[:]
         else:
-            return self.get_segmentations(user_id=self.root.config.user_id)
+            return self._segmentations_by_user.get(self.root.config.user_id, [])[:]
 
     def tool_segmentations(self) -> List[TCopickSegmentation]:
         """Get all tool generated segmentations (i.e. segmentations that have `CopickSegmentation.session_id == 0`).
@@ -705,7 +995,10 @@ class CopickRun:
         Returns:
             List[CopickSegmentation]: List of tool-generated segmentations.
         """
-        return [s for s in self.segmentations if s.session_id == "0"]
+        if self._segmentations is None:
+            _ = self.segmentations
+
+        return self._tool_segmentations[:]
 
     def get_segmentations(
         self,
@@ -727,24 +1020,47 @@ class CopickRun:
         Returns:
             List[CopickSegmentation]: List of segmentations that match the search criteria.
         """
-        ret = self.segmentations
-
-        if user_id is not None:
-            ret = [s for s in ret if s.user_id == user_id]
-
-        if session_id is not None:
-            ret = [s for s in ret if s.session_id == session_id]
-
-        if is_multilabel is not None:
-            ret = [s for s in ret if s.is_multilabel == is_multilabel]
+        if self._segmentations is None:
+            _ = self.segmentations
+
+        # Fully specified query
+        if None not in (name, user_id, session_id, voxel_size, is_multilabel):
+            return self._segmentations_index.get((name, user_id, session_id, voxel_size, is_multilabel), [])[:]
+
+        candidates = self._segmentations if user_id is None else self._segmentations_by_user.get(user_id, [])
+        return [
+            s
+            for s in candidates
+            if (session_id is None or s.session_id == session_id)
+            and (is_multilabel is None or s.is_multilabel == is_multilabel)
+            and (name is None or s.name == name)
+            and (voxel_size is None or s.voxel_size == voxel_size)
+        ]
+
+    def has_segmentation(
+        self,
+        name: str,
+        user_id: str,
+        session_id: str,
+        voxel_size: float,
+        is_multilabel: bool,
+    ) -> bool:
+        """Check whether a segmentation with the given properties exists, without building a list.
 
-        if name is not None:
-            ret = [s for s in ret if s.name == name]
+        Args:
+            name: Name of the segmentation.
+            user_id: User ID of the segmentation.
+            session_id: Session ID of the segmentation.
+            voxel_size: Voxel size of the segmentation.
+            is_multilabel: Whether the segmentation is multilabel or not.
 
-        if voxel_size is not None:
-            ret = [s for s in ret if s.voxel_size == voxel_size]
+        Returns:
+            bool: True if the segmentation exists.
+        """
+        if self._segmentations is None:
+            _ = self.segmentations
 
-        return ret
+        return (name, user_id, session_id, voxel_size, is_multilabel) in self._segmentations_index
 
     def new_voxel_spacing(self, voxel_size: float, **kwargs) -> TCopickVoxelSpacing:
         """Create a new voxel spacing object.
@@ -759,21 +1075,28 @@ class CopickRun:
         Raises:
             ValueError: If a voxel spacing with the given voxel size already exists for this run.
         """
-        if voxel_size in [vs.voxel_size for vs in self.voxel_spacings]:
-            raise ValueError(f"VoxelSpacing {voxel_size} already exists for this run.")
+        with self._lock:
+            if self._voxel_spacings is None:
+                _ = self.voxel_spacings
 
-        clz, meta_clz = self._voxel_spacing_factory()
+            if voxel_size in self._vs_by_size:
+                raise ValueError(f"VoxelSpacing {voxel_size} already exists for this run.")
 
-        vm = meta_clz(voxel_size=voxel_size, **kwargs)
-        vs = clz(run=self, meta=vm)
+            clz, meta_clz = self._voxel_spacing_factory()
 
-        # Append the voxel spacing
-        if self._voxel_spacings is None:
-            self._voxel_spacings = []
-        self._voxel_spacings.append(vs)
+            vm = meta_clz(voxel_size=voxel_size, **kwargs)
+            vs = clz(run=self, meta=vm)
+
+            # Append the voxel spacing
+            self._voxel_spacings.append(vs)
+            self._vs_by_size[voxel_size] = vs
+            pending = self._add_pending("voxel_spacings", [vs])
 
         # Ensure the voxel spacing record exists
-        vs.ensure(create=True)
+        try:
+            vs.ensure(create=True)
+        finally:
+            self._mark_stored(pending)
 
         return vs
 
@@ -796,7 +1119,57 @@ class CopickRun:
             ValueError: If picks for the given object name, session ID and user ID already exist, if the object name
                 is not found in the pickable objects, or if the user ID is not set in the root config or supplied.
         """
-        if object_name not in [o.name for o in self.root.config.pickable_objects]:
+        return self.new_picks_bulk([dict(object_name=object_name, session_id=session_id, user_id=user_id)])[0]
+
+    def new_picks_bulk(self, specs: List[Dict[str, Any]]) -> List[TCopickPicks]:
+        """Create several new picks objects at once. All specs are validated before any picks are created and the
+        picks files are written as one batch (see `CopickRun._store_picks`).
+
+        Args:
+            specs: Keyword arguments of `CopickRun.new_picks`, one dict per picks object.
+
+        Returns:
+            List[CopickPicks]: The newly created picks objects, in the order of `specs`.
+
+        Raises:
+            ValueError: If any of the specs is invalid (see `CopickRun.new_picks`) or two specs describe the same
+                picks.
+        """
+        with self._lock:
+            if self._picks is None:
+                _ = self.picks
+
+            metas = [self._new_picks_meta(**spec) for spec in specs]
+            if len({(pm.pickable_object_name, pm.user_id, pm.session_id) for pm in metas}) < len(metas):
+                raise ValueError("Multiple specs describe the same picks.")
+
+            clz = self._picks_factory()
+
+            picks = []
+            for pm in metas:
+                pick = clz(run=self, file=pm)
+
+                self._picks.append(pick)
+                self._picks_index.setdefault(_picks_key(pick), []).append(pick)
+                if pick._is_tool:
+                    self._tool_picks.append(pick)
+                else:
+                    self._user_picks.append(pick)
+                self._picks_by_user.setdefault(pick.user_id, []).append(pick)
+                picks.append(pick)
+            pending = self._add_pending("picks", picks)
+
+        # Create the picks files
+        try:
+            self._store_picks(picks)
+        finally:
+            self._mark_stored(pending)
+
+        return picks
+
+    def _new_picks_meta(self, object_name: str, session_id: str, user_id: Optional[str] = None) -> "CopickPicksFile":
+        """Validate the arguments of `CopickRun.new_picks` and create the metadata for the new picks."""
+        if self.root.get_object(object_name) is None:
             raise ValueError(f"Object name {object_name} not found in pickable objects.")
 
         uid = self.root.config.user_id
@@ -807,28 +1180,24 @@ class CopickRun:
         if uid is None:
             raise ValueError("User ID must be set in the root config or supplied to new_picks.")
 
-        if self.get_picks(object_name=object_name, session_id=session_id, user_id=uid):
+        if self.has_picks(object_name, uid, session_id):
             raise ValueError(f"Picks for {object_name} by user/tool {uid} already exist in session {session_id}.")
 
-        pm = CopickPicksFile(
+        return CopickPicksFile(
             pickable_object_name=object_name,
             user_id=uid,
             session_id=session_id,
             run_name=self.name,
         )
 
-        clz = self._picks_factory()
-
-        picks = clz(run=self, file=pm)
+    def _store_picks(self, picks: List[TCopickPicks]) -> None:
+        """Store several picks. Override to write them to the storage backend in a single batch.
 
-        if self._picks is None:
-            self._picks = []
-        self._picks.append(picks)
-
-        # Create the picks file
-        picks.store()
-
-        return picks
+        Args:
+            picks: The picks to store.
+        """
+        for pick in picks:
+            pick.store()
 
     def _picks_factory(self) -> Type[TCopickPicks]:
         """Override this method to return the picks class."""
@@ -850,7 +1219,65 @@ class CopickRun:
             ValueError: If a mesh for the given object name, session ID and user ID already exist, if the object name
                 is not found in the pickable objects, or if the user ID is not set in the root config or supplied.
         """
-        if object_name not in [o.name for o in self.root.config.pickable_objects]:
+        return self.new_meshes([dict(object_name=object_name, session_id=session_id, user_id=user_id, **kwargs)])[0]
+
+    def new_meshes(self, specs: List[Dict[str, Any]]) -> List[TCopickMesh]:
+        """Create several new mesh objects at once. All specs are validated before any mesh is created and the mesh
+        files are written as one batch (see `CopickRun._store_meshes`).
+
+        Args:
+            specs: Keyword arguments of `CopickRun.new_mesh`, one dict per mesh.
+
+        Returns:
+            List[CopickMesh]: The newly created mesh objects, in the order of `specs`.
+
+        Raises:
+            ValueError: If any of the specs is invalid (see `CopickRun.new_mesh`) or two specs describe the same mesh.
+        """
+        with self._lock:
+            if self._meshes is None:
+                _ = self.meshes
+
+            metas = [self._new_mesh_meta(**spec) for spec in specs]
+            if len({(mm.pickable_object_name, mm.user_id, mm.session_id) for mm in metas}) < len(metas):
+                raise ValueError("Multiple specs describe the same mesh.")
+
+            import trimesh
+
+            clz, _ = self._mesh_factory()
+
+            meshes = []
+            for mm in metas:
+                # Need to create an empty trimesh.Trimesh object first, because empty scenes can't be exported.
+                mesh = clz(run=self, meta=mm, mesh=trimesh.Trimesh().scene())
+
+                self._meshes.append(mesh)
+                self._meshes_index.setdefault(_picks_key(mesh), []).append(mesh)
+                if mesh._is_tool:
+                    self._tool_meshes.append(mesh)
+                else:
+                    self._user_meshes.append(mesh)
+                self._meshes_by_user.setdefault(mesh.user_id, []).append(mesh)
+                meshes.append(mesh)
+            pending = self._add_pending("meshes", meshes)
+
+        # Create the mesh files
+        try:
+            self._store_meshes(meshes)
+        finally:
+            self._mark_stored(pending)
+
+        return meshes
+
+    def _new_mesh_meta(
+        self,
+        object_name: str,
+        session_id: str,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> "CopickMeshMeta":
+        """Validate the arguments of `CopickRun.new_mesh` and create the metadata for the new mesh."""
+        if self.root.get_object(object_name) is None:
             raise ValueError(f"Object name {object_name} not found in pickable objects.")
 
         uid = self.root.config.user_id
@@ -861,32 +1288,26 @@ class CopickRun:
         if uid is None:
             raise ValueError("User ID must be set in the root config or supplied to new_mesh.")
 
-        if self.get_meshes(object_name=object_name, session_id=session_id, user_id=uid):
+        if self.has_mesh(object_name, uid, session_id):
             raise ValueError(f"Mesh for {object_name} by user/tool {uid} already exist in session {session_id}.")
 
-        clz, meta_clz = self._mesh_factory()
+        _, meta_clz = self._mesh_factory()
 
-        mm = meta_clz(
+        return meta_clz(
             pickable_object_name=object_name,
             user_id=uid,
             session_id=session_id,
             **kwargs,
         )
 
-        # Need to create an empty trimesh.Trimesh object first, because empty scenes can't be exported.
-        tmesh = trimesh.Trimesh()
-        scene = tmesh.scene()
+    def _store_meshes(self, meshes: List[TCopickMesh]) -> None:
+        """Store several meshes. Override to write them to the storage backend in a single batch.
 
-        mesh = clz(run=self, meta=mm, mesh=scene)
-
-        if self._meshes is None:
-            self._meshes = []
-        self._meshes.append(mesh)
-
-        # Create the mesh file
-        mesh.store()
-
-        return mesh
+        Args:
+            meshes: The meshes to store.
+        """
+        for mesh in meshes:
+            mesh.store()
 
     def _mesh_factory(self) -> Tuple[Type[TCopickMesh], Type["CopickMeshMeta"]]:
         """Override this method to return the mesh class and mesh metadata."""
@@ -899,6 +1320,7 @@ class CopickRun:
         session_id: str,
         is_multilabel: bool,
         user_id: Optional[str] = None,
+        create_store: bool = True,
         **kwargs,
     ) -> TCopickSegmentation:
         """Create a new segmentation object.
@@ -909,6 +1331,8 @@ class CopickRun:
             session_id: Session ID for the segmentation.
             is_multilabel: Whether the segmentation is multilabel or not.
             user_id: User ID for the segmentation.
+            create_store: Whether to create the Zarr-store for the segmentation in the storage backend. If False, the
+                store is created on the first call to `CopickSegmentation.zarr`.
             **kwargs: Additional keyword arguments for the segmentation metadata.
 
         Returns:
@@ -919,10 +1343,86 @@ class CopickRun:
                 exist, if the object name is not found in the pickable objects, if the voxel size is not found in the
                 voxel spacings, or if the user ID is not set in the root config or supplied.
         """
-        if not is_multilabel and name not in [o.name for o in self.root.config.pickable_objects]:
+        spec = dict(
+            voxel_size=voxel_size,
+            name=name,
+            session_id=session_id,
+            is_multilabel=is_multilabel,
+            user_id=user_id,
+            **kwargs,
+        )
+        return self.new_segmentations([spec], create_store=create_store)[0]
+
+    def new_segmentations(
+        self,
+        specs: List[Dict[str, Any]],
+        create_store: bool = True,
+    ) -> List[TCopickSegmentation]:
+        """Create several new segmentation objects at once. All specs are validated before any segmentation is created.
+
+        Args:
+            specs: Keyword arguments of `CopickRun.new_segmentation`, one dict per segmentation.
+            create_store: Whether to create the Zarr-stores for the segmentations in the storage backend.
+
+        Returns:
+            List[CopickSegmentation]: The newly created segmentation objects, in the order of `specs`.
+
+        Raises:
+            ValueError: If any of the specs is invalid (see `CopickRun.new_segmentation`) or two specs describe the same
+                segmentation.
+        """
+        with self._lock:
+            if self._segmentations is None:
+                _ = self.segmentations
+
+            metas = [self._new_segmentation_meta(**spec) for spec in specs]
+            keys = {(sm.name, sm.user_id, sm.session_id, sm.voxel_size, sm.is_multilabel) for sm in metas}
+            if len(keys) < len(metas):
+                raise ValueError("Multiple specs describe the same segmentation.")
+
+            clz, _ = self._segmentation_factory()
+
+            segs = []
+            for sm in metas:
+                seg = clz(run=self, meta=sm)
+
+                self._segmentations.append(seg)
+                self._segmentations_index.setdefault(_segmentation_key(seg), []).append(seg)
+                if seg._is_tool:
+                    self._tool_segmentations.append(seg)
+                else:
+                    self._user_segmentations.append(seg)
+                self._segmentations_by_user.setdefault(seg.user_id, []).append(seg)
+                segs.append(seg)
+            pending = self._add_pending("segmentations", segs)
+
+        # Create the zarr stores for the segmentations
+        try:
+            if create_store:
+                for seg in segs:
+                    _ = seg.zarr()
+        finally:
+            self._mark_stored(pending)
+
+        return segs
+
+    def _new_segmentation_meta(
+        self,
+        voxel_size: float,
+        name: str,
+        session_id: str,
+        is_multilabel: bool,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> "CopickSegmentationMeta":
+        """Validate the arguments of `CopickRun.new_segmentation` and create the metadata for the new segmentation."""
+        if not is_multilabel and self.root.get_object(name) is None:
             raise ValueError(f"Object name {name} not found in pickable objects.")
 
-        if voxel_size not in [vs.voxel_size for vs in self.voxel_spacings]:
+        if self._voxel_spacings is None:
+            _ = self.voxel_spacings
+
+        if voxel_size not in self._vs_by_size:
             raise ValueError(f"VoxelSpacing {voxel_size} not found in voxel spacings for run {self.name}.")
 
         uid = self.root.config.user_id
@@ -933,20 +1433,14 @@ class CopickRun:
         if uid is None:
             raise ValueError("User ID must be set in the root config or supplied to new_segmentation.")
 
-        if self.get_segmentations(
-            session_id=session_id,
-            user_id=uid,
-            name=name,
-            is_multilabel=is_multilabel,
-            voxel_size=voxel_size,
-        ):
+        if self.has_segmentation(name, uid, session_id, voxel_size, is_multilabel):
             raise ValueError(
                 f"Segmentation by user/tool {uid} already exist in session {session_id} with name {name}, voxel size of {voxel_size}, and has a multilabel flag of {is_multilabel}.",
             )
 
-        clz, meta_clz = self._segmentation_factory()
+        _, meta_clz = self._segmentation_factory()
 
-        sm = meta_clz(
+        return meta_clz(
             is_multilabel=is_multilabel,
             voxel_size=voxel_size,
             user_id=uid,
@@ -954,44 +1448,219 @@ class CopickRun:
             name=name,
             **kwargs,
         )
-        seg = clz(run=self, meta=sm)
-
-        if self._segmentations is None:
-            self._segmentations = []
-
-        self._segmentations.append(seg)
-
-        # Create the zarr store for this segmentation
-        _ = seg.zarr()
-
-        return seg
 
     def _segmentation_factory(self) -> Tuple[Type[TCopickSegmentation], Type["CopickSegmentationMeta"]]:
         """Override this method to return the segmentation class and segmentation metadata class."""
         return CopickSegmentation, CopickSegmentationMeta
 
+    def _begin_listing(self) -> int:
+        """Stamp a listing of child entities that is about to start.
+
+        Returns:
+            int: Stamp to pass to `CopickRun._take_pending` once the listing has completed.
+        """
+        with self._lock:
+            stamp = self._listings
+            self._listings += 1
+
+        return stamp
+
+    def _add_pending(self, child_type: str, entities: List[Any]) -> List[List[Any]]:
+        """Record newly created entities as not yet confirmed by a listing. Must be called while holding
+        CopickRun._lock."""
+        entries = [[e, None] for e in entities]
+        self._pending[child_type].extend(entries)
+        return entries
+
+    def _mark_stored(self, entries: List[List[Any]]) -> None:
+        """Record that the entities returned by `CopickRun._add_pending` were written to the storage backend."""
+        with self._lock:
+            for entry in entries:
+                entry[1] = self._listings
+
+    def _take_pending(self, child_type: str, stamp: int) -> List[Any]:
+        """Forget the created entities confirmed by the listing with the given stamp and return the others, which the
+        listing may have missed. Must be called while holding CopickRun._lock."""
+        pending = [entry for entry in self._pending[child_type] if entry[1] is None or entry[1] > stamp]
+        self._pending[child_type] = pending
+        return [e for e, _ in pending]
+
     def refresh_voxel_spacings(self) -> None:
         """Refresh the voxel spacings."""
-        self._voxel_spacings = self.query_voxelspacings()
+        stamp = self._begin_listing()
+        self._set_voxel_spacings(self.query_voxelspacings(), stamp)
+
+    def _set_voxel_spacings(self, voxel_spacings: List[Any], stamp: int) -> None:
+        """Replace the voxel spacings with the result of the listing with the given stamp."""
+        with self._lock:
+            # Keep voxel spacings created on this run that the listing may have missed
+            created = self._take_pending("voxel_spacings", stamp)
+            voxel_spacings = _merge_created(voxel_spacings, created, lambda vs: vs.voxel_size)
+
+            vs_by_size = {vs.voxel_size: vs for vs in voxel_spacings}
+            self._voxel_spacings, self._vs_by_size = voxel_spacings, vs_by_size
+            self.last_refresh = time.time()
 
     def refresh_picks(self) -> None:
         """Refresh the picks."""
-        self._picks = self.query_picks()
+        stamp = self._begin_listing()
+        self._set_picks(self.query_picks(), stamp)
+
+    def _set_picks(self, picks: List[Any], stamp: int) -> None:
+        """Replace the picks with the result of the listing with the given stamp."""
+        with self._lock:
+            # Keep picks created on this run that the listing may have missed
+            picks = _merge_created(picks, self._take_pending("picks", stamp), _picks_key)
+
+            index = _group_by(picks, _picks_key)
+            tool = [p for p in picks if p._is_tool]
+            user = [p for p in picks if not p._is_tool]
+            by_user = _group_by_user(picks)
+            self._picks, self._picks_index, self._tool_picks, self._user_picks, self._picks_by_user = (
+                picks,
+                index,
+                tool,
+                user,
+                by_user,
+            )
+            self.last_refresh = time.time()
 
     def refresh_meshes(self) -> None:
         """Refresh the meshes."""
-        self._meshes = self.query_meshes()
+        stamp = self._begin_listing()
+        self._set_meshes(self.query_meshes(), stamp)
+
+    def _set_meshes(self, meshes: List[Any], stamp: int) -> None:
+        """Replace the meshes with the result of the listing with the given stamp."""
+        with self._lock:
+            # Keep meshes created on this run that the listing may have missed
+            meshes = _merge_created(meshes, self._take_pending("meshes", stamp), _picks_key)
+
+            index = _group_by(meshes, _picks_key)
+            tool = [m for m in meshes if m._is_tool]
+            user = [m for m in meshes if not m._is_tool]
+            by_user = _group_by_user(meshes)
+            self._meshes, self._meshes_index, self._tool_meshes, self._user_meshes, self._meshes_by_user = (
+                meshes,
+                index,
+                tool,
+                user,
+                by_user,
+            )
+            self.last_refresh = time.time()
 
     def refresh_segmentations(self) -> None:
         """Refresh the segmentations."""
-        self._segmentations = self.query_segmentations()
+        stamp = self._begin_listing()
+        self._set_segmentations(self.query_segmentations(), stamp)
+
+    def _set_segmentations(self, segmentations: List[Any], stamp: int) -> None:
+        """Replace the segmentations with the result of the listing with the given stamp."""
+        with self._lock:
+            # Keep segmentations created on this run that the listing may have missed
+            created = self._take_pending("segmentations", stamp)
+            segmentations = _merge_created(segmentations, created, _segmentation_key)
+
+            index = _group_by(segmentations, _segmentation_key)
+            tool = [s for s in segmentations if s._is_tool]
+            user = [s for s in segmentations if not s._is_tool]
+            by_user = _group_by_user(segmentations)
+            (
+                self._segmentations,
+                self._segmentations_index,
+                self._tool_segmentations,
+                self._user_segmentations,
+                self._segmentations_by_user,
+            ) = (segmentations, index, tool, user, by_user)
+            self.last_refresh = time.time()
+
+    def _query_manifest(self) -> Optional[Any]:
+        """Override to list all child entities of this run at once. While `CopickRun.refresh` runs, the result is
+        available to the query methods as `CopickRun._manifest`, so they can share one listing instead of scanning the
+        storage backend once per entity type.
+
+        Returns:
+            Backend specific listing, or `None` if the backend does not support listing all entities at once.
+        """
+        return None
 
     def refresh(self) -> None:
-        """Refresh all child types."""
-        self.refresh_voxel_spacings()
-        self.refresh_picks()
-        self.refresh_meshes()
-        self.refresh_segmentations()
+        """Refresh all child types. The child types are queried concurrently."""
+        # The queries may answer from the manifest, so the listing starts before the manifest is taken
+        stamp = self._begin_listing()
+        self._manifest = self._query_manifest()
+
+        def refresh_child(query: Callable[[], List[Any]], publish: Callable[[List[Any], int], None]) -> None:
+            publish(query(), stamp)
+
+        try:
+            tasks = [
+                (self.query_voxelspacings, self._set_voxel_spacings),
+                (self.query_picks, self._set_picks),
+                (self.query_meshes, self._set_meshes),
+                (self.query_segmentations, self._set_segmentations),
+            ]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [executor.submit(refresh_child, query, publish) for query, publish in tasks]
+                for future in futures:
+                    future.result()
+        finally:
+            self._manifest = None
+
+    def refresh_async(
+        self,
+        on_done: Optional[Callable[[concurrent.futures.Future], None]] = None,
+    ) -> concurrent.futures.Future:
+        """Refresh all child types in a background thread. Until the refresh completes, the child entities that are
+        already cached keep being returned. If the refresh fails, the cached entities are kept and the exception is
+        stored in the returned future.
+
+        Args:
+            on_done: Called with the future once the refresh has completed or failed.
+
+        Returns:
+            concurrent.futures.Future: Future of the refresh. If a background refresh is already running, its future is
+                returned instead of starting a new one.
+        """
+        future = self._refresh_future
+        if future is None or future.done():
+            self._refresh_started = time.time()
+            future = _refresh_executor.submit(self.refresh)
+            self._refresh_future = future
+
+        if on_done is not None:
+            future.add_done_callback(on_done)
+
+        return future
+
+    def _revalidate(self) -> None:
+        """Start a background refresh if the cached child entities are older than `CopickRun.refresh_ttl`."""
+        if self.refresh_ttl is None or self.last_refresh is None:
+            return
+
+        # A failed background refresh is only retried after another refresh_ttl seconds
+        if time.time() - max(self.last_refresh, self._refresh_started) >= self.refresh_ttl:
+            self.refresh_async()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        # The lock and the background refresh can't be pickled, they are not carried over to the copy
+        del state["_lock"]
+        state["_refresh_future"] = None
+        state["_manifest"] = None
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._lock = threading.RLock()
 
     def ensure(self, create: bool = False) -> bool:
         """Check if the run record exists, optionally create it if it does not.
@@ -1038,10 +1707,12 @@ class CopickVoxelSpacing:
 
         self._tomograms: Optional[List[TCopickTomogram]] = None
         """References to the tomograms for this voxel spacing."""
+        self._tomograms_by_type: Dict[str, TCopickTomogram] = {}
+        """Index of CopickVoxelSpacing.tomograms by tomo_type, kept in sync with CopickVoxelSpacing._tomograms."""
 
-        if config is not None:
-            tomo_metas = [CopickTomogramMeta(tomo_type=tt) for tt in config.tomograms[self.voxel_size]]
-            self._tomograms = [CopickTomogram(voxel_spacing=self, meta=tm, config=config) for tm in tomo_metas]
+        self._config: Optional[TCopickConfig] = config
+        """Configuration to populate the tomograms from when CopickVoxelSpacing.tomograms is accessed for the first
+        time."""
 
     def __repr__(self):
         lts = None if self._tomograms is None else len(self._tomograms)
@@ -1058,7 +1729,13 @@ class CopickVoxelSpacing:
     @property
     def tomograms(self) -> List[TCopickTomogram]:
         if self._tomograms is None:
-            self._tomograms = self.query_tomograms()
+            config = self._config
+            if config is not None:
+                tomo_metas = [CopickTomogramMeta(tomo_type=tt) for tt in config.tomograms[self.voxel_size]]
+                self._tomograms = [CopickTomogram(voxel_spacing=self, meta=tm, config=config) for tm in tomo_metas]
+                self._tomograms_by_type = _first_by(self._tomograms, lambda t: t.tomo_type)
+            else:
+                self.refresh_tomograms()
 
         return self._tomograms
 
@@ -1071,24 +1748,27 @@ class CopickVoxelSpacing:
         Returns:
             CopickTomogram: The tomogram with the given type, or `None` if not found.
         """
-        for tomo in self.tomograms:
-            if tomo.tomo_type == tomo_type:
-                return tomo
-        return None
+        if self._tomograms is None:
+            _ = self.tomograms
+
+        return self._tomograms_by_type.get(tomo_type)
 
     def refresh_tomograms(self) -> None:
         """Refresh `CopickVoxelSpacing.tomograms` from storage."""
         self._tomograms = self.query_tomograms()
+        self._tomograms_by_type = _first_by(self._tomograms, lambda t: t.tomo_type)
 
     def refresh(self) -> None:
         """Refresh `CopickVoxelSpacing.tomograms` from storage."""
         self.refresh_tomograms()
 
-    def new_tomogram(self, tomo_type: str, **kwargs) -> TCopickTomogram:
+    def new_tomogram(self, tomo_type: str, create_store: bool = True, **kwargs) -> TCopickTomogram:
         """Create a new tomogram object, also creates the Zarr-store in the storage backend.
 
         Args:
             tomo_type: Type of the tomogram to create.
+            create_store: Whether to create the Zarr-store for the tomogram in the storage backend. If False, the store
+                is created on the first call to `CopickTomogram.zarr`.
             **kwargs: Additional keyword arguments for the tomogram metadata.
 
         Returns:
@@ -1097,23 +1777,52 @@ class CopickVoxelSpacing:
         Raises:
             ValueError: If a tomogram with the given type already exists for this voxel spacing.
         """
-        if tomo_type in [tomo.tomo_type for tomo in self.tomograms]:
-            raise ValueError(f"Tomogram type {tomo_type} already exists for this voxel spacing.")
+        return self.new_tomograms([dict(tomo_type=tomo_type, **kwargs)], create_store=create_store)[0]
 
-        clz, meta_clz = self._tomogram_factory()
+    def new_tomograms(self, specs: List[Dict[str, Any]], create_store: bool = True) -> List[TCopickTomogram]:
+        """Create several new tomogram objects at once. All specs are validated before any tomogram is created.
 
-        tm = meta_clz(tomo_type=tomo_type, **kwargs)
-        tomo = clz(voxel_spacing=self, meta=tm)
+        Args:
+            specs: Keyword arguments of `CopickVoxelSpacing.new_tomogram`, one dict per tomogram.
+            create_store: Whether to create the Zarr-stores for the tomograms in the storage backend.
 
-        # Append the tomogram
+        Returns:
+            List[CopickTomogram]: The newly created tomogram objects, in the order of `specs`.
+
+        Raises:
+            ValueError: If a tomogram with one of the given types already exists for this voxel spacing, or two specs
+                have the same type.
+        """
         if self._tomograms is None:
-            self._tomograms = []
-        self._tomograms.append(tomo)
+            _ = self.tomograms
+
+        clz, meta_clz = self._tomogram_factory()
+
+        metas = []
+        for spec in specs:
+            tm = meta_clz(**spec)
+            if tm.tomo_type in self._tomograms_by_type:
+                raise ValueError(f"Tomogram type {tm.tomo_type} already exists for this voxel spacing.")
+            metas.append(tm)
+
+        if len({tm.tomo_type for tm in metas}) < len(metas):
+            raise ValueError("Multiple specs describe the same tomogram.")
+
+        tomos = []
+        for tm in metas:
+            tomo = clz(voxel_spacing=self, meta=tm)
 
-        # Create the zarr store for this tomogram
-        _ = tomo.zarr()
+            # Append the tomogram
+            self._tomograms.append(tomo)
+            self._tomograms_by_type[tomo.tomo_type] = tomo
+            tomos.append(tomo)
 
-        return tomo
+        # Create the zarr stores for the tomograms
+        if create_store:
+            for tomo in tomos:
+                _ = tomo.zarr()
+
+        return tomos
 
     def _tomogram_factory(self) -> Tuple[Type[TCopickTomogram], Type["CopickTomogramMeta"]]:
         """Override this method to return the tomogram class."""
@@ -1138,7 +1847,9 @@ class CopickTomogramMeta(BaseModel):
         tomo_type: Type of the tomogram.
     """
 
-    tomo_type: str
+    model_config = ConfigDict(frozen=True)
+
+    tomo_type: _InternedStr
 
 
 class CopickTomogram:
@@ -1153,6 +1864,8 @@ class CopickTomogram:
         tomo_type (str): Type of the tomogram.
     """
 
+    __slots__ = ("meta", "voxel_spacing", "tomo_type", "_features", "_features_by_type", "_zarr_store", "_config")
+
     def __init__(
         self,
         voxel_spacing: TCopickVoxelSpacing,
@@ -1161,26 +1874,33 @@ class CopickTomogram:
     ):
         self.meta = meta
         self.voxel_spacing = voxel_spacing
+        self.tomo_type: str = meta.tomo_type
 
         self._features: Optional[List[TCopickFeatures]] = None
         """Features for this tomogram."""
+        self._features_by_type: Dict[str, TCopickFeatures] = {}
+        """Index of CopickTomogram.features by feature_type, kept in sync with CopickTomogram._features."""
+        self._zarr_store: Optional[MutableMapping] = None
+        """Zarr store opened by CopickTomogram.zarr, reused until CopickTomogram.invalidate_zarr is called."""
 
-        if config is not None and self.tomo_type in config.features[self.voxel_spacing.voxel_size]:
-            feat_metas = [CopickFeaturesMeta(tomo_type=self.tomo_type, feature_type=ft) for ft in config.feature_types]
-            self._features = [CopickFeatures(tomogram=self, meta=fm) for fm in feat_metas]
+        self._config: Optional[TCopickConfig] = config
+        """Configuration to populate the features from when CopickTomogram.features is accessed for the first time."""
 
     def __repr__(self):
         lft = None if self._features is None else len(self._features)
         return f"CopickTomogram(tomo_type={self.tomo_type}, len(features)={lft}) at {hex(id(self))}"
 
-    @property
-    def tomo_type(self) -> str:
-        return self.meta.tomo_type
-
     @property
     def features(self) -> List[TCopickFeatures]:
         if self._features is None:
-            self._features = self.query_features()
+            config = self._config
+            if config is not None and self.tomo_type in config.features[self.voxel_spacing.voxel_size]:
+                feat_metas = [
+                    CopickFeaturesMeta(tomo_type=self.tomo_type, feature_type=ft) for ft in config.feature_types
+                ]
+                self.features = [CopickFeatures(tomogram=self, meta=fm) for fm in feat_metas]
+            else:
+                self.refresh_features()
 
         return self._features
 
@@ -1188,6 +1908,7 @@ class CopickTomogram:
     def features(self, value: List[TCopickFeatures]) -> None:
         """Set the features."""
         self._features = value
+        self._features_by_type = _first_by(self._features, lambda f: f.feature_type)
 
     def get_features(self, feature_type: str) -> Union[TCopickFeatures, None]:
         """Get feature maps by type.
@@ -1198,10 +1919,10 @@ class CopickTomogram:
         Returns:
             CopickFeatures: The feature map with the given type, or `None` if not found.
         """
-        for feat in self.features:
-            if feat.feature_type == feature_type:
-                return feat
-        return None
+        if self._features is None:
+            _ = self.features
+
+        return self._features_by_type.get(feature_type)
 
     def new_features(self, feature_type: str, **kwargs) -> TCopickFeatures:
         """Create a new feature map object. Also creates the Zarr-store for the map in the storage backend.
@@ -1216,7 +1937,10 @@ class CopickTomogram:
         Raises:
             ValueError: If a feature map with the given type already exists for this tomogram.
         """
-        if feature_type in [f.feature_type for f in self.features]:
+        if self._features is None:
+            _ = self.features
+
+        if feature_type in self._features_by_type:
             raise ValueError(f"Feature type {feature_type} already exists for this tomogram.")
 
         clz, meta_clz = self._feature_factory()
@@ -1225,10 +1949,8 @@ class CopickTomogram:
         feat = clz(tomogram=self, meta=fm)
 
         # Append the feature set
-        if self._features is None:
-            self._features = []
-
         self._features.append(feat)
+        self._features_by_type[feature_type] = feat
 
         # Create the zarr store for this feature set
         _ = feat.zarr()
@@ -1245,16 +1967,34 @@ class CopickTomogram:
 
     def refresh_features(self) -> None:
         """Refresh `CopickTomogram.features` from storage."""
-        self._features = self.query_features()
+        self.features = self.query_features()
 
     def refresh(self) -> None:
-        """Refresh `CopickTomogram.features` from storage."""
+        """Refresh `CopickTomogram.features` from storage and drop the cached Zarr store."""
         self.refresh_features()
+        self.invalidate_zarr()
+
+    def _open_zarr(self) -> MutableMapping:
+        """Override to open the Zarr store for this tomogram. Also needs to handle creating the store if it
+        doesn't exist. Creating the store must not write any array data (chunks), as it is also called when
+        creating new, empty entities."""
+        raise NotImplementedError("_open_zarr must be implemented for CopickTomogram.")
 
     def zarr(self) -> MutableMapping:
-        """Override to return the Zarr store for this tomogram. Also needs to handle creating the store if it
-        doesn't exist."""
-        raise NotImplementedError("zarr must be implemented for CopickTomogram.")
+        """Get the Zarr store for this tomogram. The store is opened once and reused until
+        `CopickTomogram.invalidate_zarr` is called.
+
+        Returns:
+            MutableMapping: The Zarr store for this tomogram.
+        """
+        if self._zarr_store is None:
+            self._zarr_store = self._open_zarr()
+
+        return self._zarr_store
+
+    def invalidate_zarr(self) -> None:
+        """Drop the cached Zarr store, so the next call to `CopickTomogram.zarr` opens it again."""
+        self._zarr_store = None
 
 
 class CopickFeaturesMeta(BaseModel):
@@ -1265,8 +2005,10 @@ class CopickFeaturesMeta(BaseModel):
         feature_type: Type of the features contained.
     """
 
-    tomo_type: str
-    feature_type: str
+    model_config = ConfigDict(frozen=True)
+
+    tomo_type: _InternedStr
+    feature_type: _InternedStr
 
 
 class CopickFeatures:
@@ -1279,6 +2021,8 @@ class CopickFeatures:
         feature_type (str): Type of the features contained.
     """
 
+    __slots__ = ("meta", "tomogram", "tomo_type", "feature_type", "_zarr_store")
+
     def __init__(self, tomogram: TCopickTomogram, meta: CopickFeaturesMeta):
         """
 
@@ -1288,22 +2032,35 @@ class CopickFeatures:
         """
         self.meta: CopickFeaturesMeta = meta
         self.tomogram: TCopickTomogram = tomogram
+        self.tomo_type: str = meta.tomo_type
+        self.feature_type: str = meta.feature_type
+        self._zarr_store: Optional[MutableMapping] = None
+        """Zarr store opened by CopickFeatures.zarr, reused until CopickFeatures.invalidate_zarr is called."""
 
     def __repr__(self):
         return f"CopickFeatures(tomo_type={self.tomo_type}, feature_type={self.feature_type}) at {hex(id(self))}"
 
-    @property
-    def tomo_type(self) -> str:
-        return self.meta.tomo_type
-
-    @property
-    def feature_type(self) -> str:
-        return self.meta.feature_type
+    def _open_zarr(self) -> MutableMapping:
+        """Override to open the Zarr store for this feature set. Also needs to handle creating the store if it
+        doesn't exist. Creating the store must not write any array data (chunks), as it is also called when
+        creating new, empty entities."""
+        raise NotImplementedError("_open_zarr must be implemented for CopickFeatures.")
 
     def zarr(self) -> MutableMapping:
-        """Override to return the Zarr store for this feature set. Also needs to handle creating the store if it
-        doesn't exist."""
-        raise NotImplementedError("zarr must be implemented for CopickFeatures.")
+        """Get the Zarr store for this feature set. The store is opened once and reused until
+        `CopickFeatures.invalidate_zarr` is called.
+
+        Returns:
+            MutableMapping: The Zarr store for this feature set.
+        """
+        if self._zarr_store is None:
+            self._zarr_store = self._open_zarr()
+
+        return self._zarr_store
+
+    def invalidate_zarr(self) -> None:
+        """Drop the cached Zarr store, so the next call to `CopickFeatures.zarr` opens it again."""
+        self._zarr_store = None
 
 
 class CopickPicksFile(BaseModel):
@@ -1322,16 +2079,150 @@ class CopickPicksFile(BaseModel):
 
     """
 
-    pickable_object_name: str
-    user_id: str
-    session_id: Union[str, Literal["0"]]
-    run_name: Optional[str]
-    voxel_spacing: Optional[float]
-    unit: str = "angstrom"
+    pickable_object_name: _InternedStr
+    user_id: _InternedStr
+    session_id: Union[_InternedStr, Literal["0"]]
+    run_name: Optional[str] = None
+    voxel_spacing: Optional[float] = None
+    unit: _InternedStr = "angstrom"
     points: Optional[List[TCopickPoint]] = None
     trust_orientation: Optional[bool] = True
 
 
+class CopickPicksArray:
+    """Struct-of-arrays representation of a set of points, for vectorized processing of picks. Iterating over or
+    indexing into the array yields CopickPoint objects created from the rows of the arrays, slicing yields a
+    CopickPicksArray.
+
+    Attributes:
+        locations (np.ndarray): (N, 3) array of point locations (x, y, z).
+        transforms (np.ndarray): (N, 4, 4) array of transformation matrices.
+        instance_ids (np.ndarray): (N,) array of instance IDs.
+        scores (np.ndarray): (N,) array of score values.
+    """
+
+    def __init__(
+        self,
+        locations: np.ndarray,
+        transforms: Optional[np.ndarray] = None,
+        instance_ids: Optional[np.ndarray] = None,
+        scores: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            locations: (N, 3) array of point locations (x, y, z).
+            transforms: (N, 4, 4) array of transformation matrices. Defaults to identity matrices.
+            instance_ids: (N,) array of instance IDs. Defaults to 0.
+            scores: (N,) array of score values. Defaults to 1.0.
+        """
+        self.locations = np.asarray(locations, dtype=np.float64)
+        if self.locations.size == 0:
+            self.locations = self.locations.reshape(0, 3)
+        if self.locations.ndim != 2 or self.locations.shape[1] != 3:
+            raise ValueError(f"locations must have shape (N, 3), got {self.locations.shape}.")
+        n = self.locations.shape[0]
+
+        if transforms is None:
+            transforms = np.tile(np.eye(4), (n, 1, 1))
+        self.transforms = np.asarray(transforms, dtype=np.float64)
+
+        if instance_ids is None:
+            instance_ids = np.zeros(n, dtype=np.int64)
+        self.instance_ids = np.asarray(instance_ids, dtype=np.int64)
+
+        if scores is None:
+            scores = np.ones(n, dtype=np.float64)
+        self.scores = np.asarray(scores, dtype=np.float64)
+
+        if self.transforms.shape != (n, 4, 4):
+            raise ValueError(f"transforms must have shape ({n}, 4, 4), got {self.transforms.shape}.")
+        if not np.all(self.transforms[:, 3, :] == [0.0, 0.0, 0.0, 1.0]):
+            raise ValueError("Last row of all transformation matrices must be [0, 0, 0, 1].")
+        if self.instance_ids.shape != (n,):
+            raise ValueError(f"instance_ids must have shape ({n},), got {self.instance_ids.shape}.")
+        if self.scores.shape != (n,):
+            raise ValueError(f"scores must have shape ({n},), got {self.scores.shape}.")
+
+    def __repr__(self):
+        return f"CopickPicksArray(len={len(self)}) at {hex(id(self))}"
+
+    def __len__(self) -> int:
+        return self.locations.shape[0]
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[TCopickPoint, "CopickPicksArray"]:
+        if isinstance(i, slice):
+            return CopickPicksArray(
+                locations=self.locations[i],
+                transforms=self.transforms[i],
+                instance_ids=self.instance_ids[i],
+                scores=self.scores[i],
+            )
+        if not isinstance(i, (int, np.integer)):
+            raise TypeError(f"CopickPicksArray indices must be integers or slices, not {type(i).__name__}.")
+
+        return CopickPoint._from_row(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield CopickPoint._from_row(self, i)
+
+    @classmethod
+    def from_points(cls, points: List[TCopickPoint]) -> "CopickPicksArray":
+        """Create a CopickPicksArray from a list of points. Points without a score get a NaN score, points without an
+        instance ID get instance ID 0 (the default of `CopickPoint.instance_id`).
+
+        Args:
+            points: List of CopickPoint objects.
+
+        Returns:
+            CopickPicksArray: The points as struct-of-arrays.
+        """
+        return cls(
+            locations=np.asarray([p.location for p in points], dtype=np.float64),
+            transforms=np.asarray([p.transformation_ for p in points], dtype=np.float64).reshape(-1, 4, 4),
+            instance_ids=np.asarray([0 if p.instance_id is None else p.instance_id for p in points], dtype=np.int64),
+            scores=np.asarray([np.nan if p.score is None else p.score for p in points], dtype=np.float64),
+        )
+
+    @classmethod
+    def from_dicts(cls, points: List[Dict[str, Any]]) -> "CopickPicksArray":
+        """Create a CopickPicksArray from serialized points (as in the `points` list of a picks file), without creating
+        CopickPoint objects. Omitted fields get the defaults of CopickPoint, null scores and instance IDs are handled as
+        in `CopickPicksArray.from_points`.
+
+        Args:
+            points: List of serialized CopickPoint objects.
+
+        Returns:
+            CopickPicksArray: The points as struct-of-arrays.
+        """
+        identity = np.eye(4)
+        scores = [p.get("score", 1.0) for p in points]
+        return cls(
+            locations=np.asarray(
+                [(p["location"]["x"], p["location"]["y"], p["location"]["z"]) for p in points],
+                dtype=np.float64,
+            ),
+            transforms=np.asarray(
+                [identity if p.get("transformation_") is None else p["transformation_"] for p in points],
+                dtype=np.float64,
+            ).reshape(-1, 4, 4),
+            instance_ids=np.asarray(
+                [0 if p.get("instance_id") is None else p["instance_id"] for p in points],
+                dtype=np.int64,
+            ),
+            scores=np.asarray([np.nan if sc is None else sc for sc in scores], dtype=np.float64),
+        )
+
+    def to_points(self) -> List[TCopickPoint]:
+        """Convert to a list of points.
+
+        Returns:
+            List[CopickPoint]: The points as CopickPoint objects.
+        """
+        return list(self)
+
+
 class CopickPicks:
     """Encapsulates all data pertaining to a specific set of picked points. This includes the locations, orientations,
     and other metadata for the set of points.
@@ -1342,6 +2233,7 @@ class CopickPicks:
         points (List[CopickPoint]): Points for this pick. Either populated from storage or lazily loaded when
             `CopickPicks.points` is accessed **for the first time**.
         from_tool (bool): Flag to indicate if this pick was generated by a tool.
+        from_user (bool): Flag to indicate if this pick was generated by a user.
         pickable_object_name (str): Pickable object name from `CopickConfig.pickable_objects[...].name`
         user_id (str): Unique identifier for the user or tool name.
         session_id (str): Unique identifier for the pick session
@@ -1358,6 +2250,12 @@ class CopickPicks:
         self.meta: CopickPicksFile = file
         self.run: TCopickRun = run
 
+        self._is_tool: bool = file.session_id == "0"
+        """Whether these picks were generated by a tool, precomputed for filtering."""
+        self._loaded: bool = file.points is not None
+        """Whether the points are available in `CopickPicks.meta`, so that picks without points are not reloaded on
+        every access."""
+
     def __repr__(self):
         lpt = None if self.meta.points is None else len(self.meta.points)
         ret = (
@@ -1375,6 +2273,11 @@ class CopickPicks:
         the file if it doesn't exist."""
         raise NotImplementedError("store must be implemented for CopickPicks.")
 
+    def _load_numpy(self) -> CopickPicksArray:
+        """Override this method to load points from storage directly as struct-of-arrays, without creating CopickPoint
+        objects. Defaults to loading the points and converting them."""
+        return CopickPicksArray.from_points(self.load().points or [])
+
     def load(self) -> CopickPicksFile:
         """Load the points from storage.
 
@@ -1382,6 +2285,7 @@ class CopickPicks:
             CopickPicksFile: The loaded points.
         """
         self.meta = self._load()
+        self._loaded = True
 
         return self.meta
 
@@ -1391,7 +2295,11 @@ class CopickPicks:
 
     @property
     def from_tool(self) -> bool:
-        return self.session_id == "0"
+        return self._is_tool
+
+    @property
+    def from_user(self) -> bool:
+        return not self._is_tool
 
     @property
     def pickable_object_name(self) -> str:
@@ -1407,14 +2315,35 @@ class CopickPicks:
 
     @property
     def points(self) -> List[TCopickPoint]:
-        if self.meta.points is None:
-            self.meta = self.load()
+        if self.meta.points is None and not self._loaded:
+            self.load()
 
         return self.meta.points
 
     @points.setter
     def points(self, value: List[TCopickPoint]) -> None:
         self.meta.points = value
+        self._loaded = True
+
+    def numpy(self) -> CopickPicksArray:
+        """Get the points as struct-of-arrays for vectorized processing. If the points have not been loaded yet, they
+        are read from storage directly into the arrays and `CopickPicks.points` stays unloaded.
+
+        Returns:
+            CopickPicksArray: The points of this pick.
+        """
+        if self.meta.points is None and not self._loaded:
+            return self._load_numpy()
+
+        return CopickPicksArray.from_points(self.points or [])
+
+    def from_numpy(self, arr: CopickPicksArray) -> None:
+        """Set the points from a struct-of-arrays (use `CopickPicks.store` to persist them).
+
+        Args:
+            arr: The points to set.
+        """
+        self.points = arr.to_points()
 
     @property
     def trust_orientation(self) -> bool:
@@ -1422,14 +2351,15 @@ class CopickPicks:
 
     @property
     def color(self) -> Union[Tuple[int, int, int, int], None]:
-        if self.run.root.get_object(self.pickable_object_name) is None:
+        obj = self.run.root.get_object(self.pickable_object_name)
+        if obj is None:
             raise ValueError(f"{self.pickable_object_name} is not a recognized object name (run: {self.run.name}).")
 
-        return self.run.root.get_object(self.pickable_object_name).color
+        return obj.color
 
     def refresh(self) -> None:
         """Refresh the points from storage."""
-        self.meta = self.load()
+        self.load()
 
 
 class CopickMeshMeta(BaseModel):
@@ -1441,9 +2371,11 @@ class CopickMeshMeta(BaseModel):
         session_id: Unique identifier for the pick session. If it is 0, this pick was generated by a tool.
     """
 
-    pickable_object_name: str
-    user_id: str
-    session_id: Union[str, Literal["0"]]
+    model_config = ConfigDict(frozen=True)
+
+    pickable_object_name: _InternedStr
+    user_id: _InternedStr
+    session_id: Union[_InternedStr, Literal["0"]]
 
 
 class CopickMesh:
@@ -1463,9 +2395,17 @@ class CopickMesh:
         color: Color of the pickable object this pick belongs to.
     """
 
-    def __init__(self, run: TCopickRun, meta: CopickMeshMeta, mesh: Optional[Geometry] = None):
+    __slots__ = ("meta", "run", "pickable_object_name", "user_id", "session_id", "_is_tool", "_mesh")
+
+    def __init__(self, run: TCopickRun, meta: CopickMeshMeta, mesh: Optional["Geometry"] = None):
         self.meta: CopickMeshMeta = meta
         self.run: TCopickRun = run
+        self.pickable_object_name: str = meta.pickable_object_name
+        self.user_id: str = meta.user_id
+        self.session_id: Union[str, Literal["0"]] = meta.session_id
+
+        self._is_tool: bool = meta.session_id == "0"
+        """Whether this mesh was generated by a tool, precomputed for filtering."""
 
         if mesh is not None:
             self._mesh = mesh
@@ -1479,23 +2419,15 @@ class CopickMesh:
         )
         return ret
 
-    @property
-    def pickable_object_name(self) -> str:
-        return self.meta.pickable_object_name
-
-    @property
-    def user_id(self) -> str:
-        return self.meta.user_id
-
-    @property
-    def session_id(self) -> Union[str, Literal["0"]]:
-        return self.meta.session_id
-
     @property
     def color(self):
-        return self.run.root.get_object(self.pickable_object_name).color
+        obj = self.run.root.get_object(self.pickable_object_name)
+        if obj is None:
+            raise ValueError(f"{self.pickable_object_name} is not a recognized object name (run: {self.run.name}).")
+
+        return obj.color
 
-    def _load(self) -> Geometry:
+    def _load(self) -> "Geometry":
         """Override this method to load mesh from a RESTful interface or filesystem."""
         raise NotImplementedError("load must be implemented for CopickMesh.")
 
@@ -1504,7 +2436,7 @@ class CopickMesh:
         the file if it doesn't exist."""
         raise NotImplementedError("store must be implemented for CopickMesh.")
 
-    def load(self) -> Geometry:
+    def load(self) -> "Geometry":
         """Load the mesh from storage.
 
         Returns:
@@ -1519,23 +2451,23 @@ class CopickMesh:
         self._store()
 
     @property
-    def mesh(self) -> Geometry:
+    def mesh(self) -> "Geometry":
         if self._mesh is None:
             self._mesh = self.load()
 
         return self._mesh
 
     @mesh.setter
-    def mesh(self, value: Geometry) -> None:
+    def mesh(self, value: "Geometry") -> None:
         self._mesh = value
 
     @property
     def from_user(self) -> bool:
-        return self.session_id != "0"
+        return not self._is_tool
 
     @property
     def from_tool(self) -> bool:
-        return self.session_id == "0"
+        return self._is_tool
 
     def refresh(self) -> None:
         """Refresh `CopickMesh.mesh` from storage."""
@@ -1555,9 +2487,11 @@ class CopickSegmentationMeta(BaseModel):
         voxel_size: Voxel size in angstrom of the tomogram this segmentation belongs to. Rounded to the third decimal.
     """
 
-    user_id: str
-    session_id: Union[str, Literal["0"]]
-    name: str
+    model_config = ConfigDict(frozen=True)
+
+    user_id: _InternedStr
+    session_id: Union[_InternedStr, Literal["0"]]
+    name: _InternedStr
     is_multilabel: bool
     voxel_size: float
 
@@ -1582,6 +2516,18 @@ class CopickSegmentation:
         color: Color of the pickable object this segmentation belongs to.
     """
 
+    __slots__ = (
+        "meta",
+        "run",
+        "user_id",
+        "session_id",
+        "name",
+        "is_multilabel",
+        "voxel_size",
+        "_is_tool",
+        "_zarr_store",
+    )
+
     def __init__(self, run: TCopickRun, meta: CopickSegmentationMeta):
         """
 
@@ -1591,6 +2537,16 @@ class CopickSegmentation:
         """
         self.meta: CopickSegmentationMeta = meta
         self.run: TCopickRun = run
+        self.user_id: str = meta.user_id
+        self.session_id: Union[str, Literal["0"]] = meta.session_id
+        self.name: str = meta.name
+        self.is_multilabel: bool = meta.is_multilabel
+        self.voxel_size: float = meta.voxel_size
+
+        self._is_tool: bool = meta.session_id == "0"
+        """Whether this segmentation was generated by a tool, precomputed for filtering."""
+        self._zarr_store: Optional[MutableMapping] = None
+        """Zarr store opened by CopickSegmentation.zarr, reused until CopickSegmentation.invalidate_zarr is called."""
 
     def __repr__(self):
         ret = (
@@ -1599,42 +2555,43 @@ class CopickSegmentation:
         )
         return ret
 
-    @property
-    def user_id(self) -> str:
-        return self.meta.user_id
-
-    @property
-    def session_id(self) -> Union[str, Literal["0"]]:
-        return self.meta.session_id
-
     @property
     def from_tool(self) -> bool:
-        return self.session_id == "0"
+        return self._is_tool
 
     @property
     def from_user(self) -> bool:
-        return self.session_id != "0"
-
-    @property
-    def is_multilabel(self) -> bool:
-        return self.meta.is_multilabel
-
-    @property
-    def voxel_size(self) -> float:
-        return self.meta.voxel_size
-
-    @property
-    def name(self) -> str:
-        return self.meta.name
+        return not self._is_tool
 
     @property
     def color(self):
         if self.is_multilabel:
             return [128, 128, 128, 0]
-        else:
-            return self.run.root.get_object(self.name).color
+
+        obj = self.run.root.get_object(self.name)
+        if obj is None:
+            raise ValueError(f"{self.name} is not a recognized object name (run: {self.run.name}).")
+
+        return obj.color
+
+    def _open_zarr(self) -> MutableMapping:
+        """Override to open the Zarr store for this segmentation. Also needs to handle creating the store if it
+        doesn't exist. Creating the store must not write any array data (chunks), as it is also called when
+        creating new, empty entities."""
+        raise NotImplementedError("_open_zarr must be implemented for CopickSegmentation.")
 
     def zarr(self) -> MutableMapping:
-        """Override to return the Zarr store for this segmentation. Also needs to handle creating the store if it
-        doesn't exist."""
-        raise NotImplementedError("zarr must be implemented for CopickSegmentation.")
+        """Get the Zarr store for this segmentation. The store is opened once and reused until
+        `CopickSegmentation.invalidate_zarr` is called.
+
+        Returns:
+            MutableMapping: The Zarr store for this segmentation.
+        """
+        if self._zarr_store is None:
+            self._zarr_store = self._open_zarr()
+
+        return self._zarr_store
+
+    def invalidate_zarr(self) -> None:
+        """Drop the cached Zarr store, so the next call to `CopickSegmentation.zarr` opens it again."""
+        self._zarr_store = None
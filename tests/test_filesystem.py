@@ -1,10 +1,18 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from pathlib import Path
 from typing import Any, Dict
 
 import numpy as np
 import pytest
 import zarr
-from copick.impl.filesystem import CopickRootFSSpec
-from copick.models import CopickPicksFile
+from copick.impl.filesystem import CopickConfigFSSpec, CopickRootFSSpec
+from copick.models import CopickPicksArray, CopickPicksFile, CopickPoint, _load_config_raw
+from fsspec.implementations.local import LocalFileSystem
 from trimesh.parent import Geometry
 
 NUMERICAL_PRECISION = 1e-8
@@ -80,6 +88,86 @@ def test_root_get_run(test_payload: Dict[str, Any]):
     assert copick_root.get_run("TS_004") is None, "Run TS_004 should not be found"
 
 
+def test_config_from_file_cache(test_payload: Dict[str, Any], tmp_path: Path):
+    with open(test_payload["cfg_file"], "r") as f:
+        data = json.load(f)
+    data["overlay_fs_args"] = {"client_kwargs": {"endpoint_url": "http://localhost:9000"}}
+
+    cfg_file = tmp_path / "config.json"
+    with open(cfg_file, "w") as f:
+        json.dump(data, f)
+
+    # Configs loaded from the same file are independent
+    a = CopickConfigFSSpec.from_file(cfg_file)
+    a.overlay_fs_args["client_kwargs"]["endpoint_url"] = "X"
+    hits = _load_config_raw.cache_info().hits
+    b = CopickConfigFSSpec.from_file(cfg_file)
+    assert _load_config_raw.cache_info().hits == hits + 1, "Config file should be read from cache"
+    assert b.overlay_fs_args["client_kwargs"]["endpoint_url"] == "http://localhost:9000", "Mutation leaked"
+
+    # Edits to the file are picked up
+    data["description"] = "An edited test project."
+    with open(cfg_file, "w") as f:
+        json.dump(data, f)
+
+    misses = _load_config_raw.cache_info().misses
+    c = CopickConfigFSSpec.from_file(cfg_file)
+    assert _load_config_raw.cache_info().misses == misses + 1, "Edited config file should be read again"
+    assert c.description == "An edited test project.", "Edited config not reloaded"
+
+
+def _config_runs_root(test_payload: Dict[str, Any], tmp_path: Path) -> CopickRootFSSpec:
+    with open(test_payload["cfg_file"], "r") as f:
+        data = json.load(f)
+    data["runs"] = ["TS_002", "TS_001"]
+
+    cfg_file = tmp_path / "config_runs.json"
+    with open(cfg_file, "w") as f:
+        json.dump(data, f)
+
+    return CopickRootFSSpec.from_file(cfg_file)
+
+
+def test_root_config_runs(test_payload: Dict[str, Any], tmp_path: Path):
+    copick_root = _config_runs_root(test_payload, tmp_path)
+
+    # Getting a run does not construct the other listed runs
+    run = copick_root.get_run("TS_001")
+    assert run is not None and run.name == "TS_001", "Run not found"
+    assert copick_root.get_run("TS_001") is run, "Run should be constructed once"
+    assert copick_root._runs is None, "Runs should not be populated"
+    assert copick_root._runs_by_name["TS_002"] is None, "Other runs should not be constructed"
+    assert copick_root.get_run("TS_003") is None, "Runs not listed in the config should not be found"
+
+    # Runs are in config order and reuse constructed runs
+    assert [r.name for r in copick_root.runs] == ["TS_002", "TS_001"], "Incorrect runs"
+    assert copick_root.runs[1] is run, "Constructed run should be reused"
+
+
+def test_root_config_runs_new_run(test_payload: Dict[str, Any], tmp_path: Path):
+    copick_root = _config_runs_root(test_payload, tmp_path)
+
+    # Adding a run before the runs are materialized
+    with pytest.raises(ValueError):
+        copick_root.new_run("TS_001")
+
+    run = copick_root.new_run("TS_004")
+    assert copick_root._runs is None, "Runs should not be populated"
+    assert copick_root.get_run("TS_004") is run, "New run not found"
+    assert [r.name for r in copick_root.runs] == ["TS_002", "TS_001", "TS_004"], "Incorrect runs"
+
+
+def test_root_config_runs_rename(test_payload: Dict[str, Any], tmp_path: Path):
+    copick_root = _config_runs_root(test_payload, tmp_path)
+
+    # Renaming a run keeps its position among the listed runs
+    run = copick_root.get_run("TS_002")
+    run.name = "TS_005"
+    assert copick_root.get_run("TS_005") is run, "Renamed run not found"
+    assert copick_root.get_run("TS_002") is None, "Old name should not be found"
+    assert [r.name for r in copick_root.runs] == ["TS_005", "TS_001"], "Incorrect runs"
+
+
 def test_root_refresh(test_payload: Dict[str, Any]):
     copick_root = test_payload["root"]
 
@@ -551,6 +639,192 @@ def test_run_new_meshes(test_payload: Dict[str, Any]):
             assert overlay_fs.exists(mesh_path_overlay + mesh), f"{mesh} not found in overlay"
 
 
+def test_run_new_picks_bulk(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    # Duplicates within the batch or with existing picks raise an error before any picks are created
+    with pytest.raises(ValueError):
+        copick_run.new_picks_bulk(
+            [
+                {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+                {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+            ],
+        )
+
+    with pytest.raises(ValueError):
+        copick_run.new_picks_bulk(
+            [
+                {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+                {"object_name": "proteasome", "session_id": "0", "user_id": "pytom"},
+            ],
+        )
+
+    assert len(copick_run.picks) == 5, "No picks should be added if the batch is invalid"
+
+    # Add two picks at once
+    picks = copick_run.new_picks_bulk(
+        [
+            {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+            {"object_name": "proteasome", "session_id": "0", "user_id": "ArtiaX"},
+        ],
+    )
+    assert [p.pickable_object_name for p in picks] == ["ribosome", "proteasome"], "Incorrect picks returned"
+    assert all(copick_run.has_picks(p.pickable_object_name, "ArtiaX", "0") for p in picks), "Picks not added"
+
+    # The picks files were written
+    copick_run.refresh_picks()
+    assert len(copick_run.picks) == 7, "Incorrect number of picks"
+    for object_name in ["ribosome", "proteasome"]:
+        pick = copick_run.get_picks(object_name=object_name, user_id="ArtiaX", session_id="0")[0]
+        assert pick.points is None, f"Picks file for {object_name} should not contain points"
+
+
+def test_run_new_meshes_bulk(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    # Duplicates within the batch or with existing meshes raise an error before any mesh is created
+    with pytest.raises(ValueError):
+        copick_run.new_meshes(
+            [
+                {"object_name": "membrane", "session_id": "0", "user_id": "ArtiaX"},
+                {"object_name": "membrane", "session_id": "0", "user_id": "ArtiaX"},
+            ],
+        )
+
+    with pytest.raises(ValueError):
+        copick_run.new_meshes(
+            [
+                {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+                {"object_name": "membrane", "session_id": "0", "user_id": "membrain"},
+            ],
+        )
+
+    assert len(copick_run.meshes) == 3, "No meshes should be added if the batch is invalid"
+
+    # Add two meshes at once
+    meshes = copick_run.new_meshes(
+        [
+            {"object_name": "membrane", "session_id": "0", "user_id": "ArtiaX"},
+            {"object_name": "ribosome", "session_id": "0", "user_id": "ArtiaX"},
+        ],
+    )
+    assert [m.pickable_object_name for m in meshes] == ["membrane", "ribosome"], "Incorrect meshes returned"
+    assert all(m in copick_run.meshes for m in meshes), "Meshes not added to meshes"
+    assert copick_run.has_mesh("membrane", "ArtiaX", "0"), "Mesh not found"
+    assert not copick_run.has_mesh("membrane", "ArtiaX", "1"), "Mesh should not exist"
+
+    # The mesh files were written
+    copick_run.refresh_meshes()
+    assert len(copick_run.meshes) == 5, "Incorrect number of meshes"
+    for object_name in ["membrane", "ribosome"]:
+        mesh = copick_run.get_meshes(object_name=object_name, user_id="ArtiaX", session_id="0")[0]
+        assert mesh.mesh is not None, f"Mesh file for {object_name} not readable"
+
+
+def test_run_new_segmentations_bulk(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    # Duplicates within the batch or with existing segmentations raise an error before any segmentation is created
+    with pytest.raises(ValueError):
+        copick_run.new_segmentations(
+            [
+                {"voxel_size": 10.0, "name": "ribosome", "session_id": "0", "is_multilabel": False, "user_id": "pytom"},
+                {"voxel_size": 10.0, "name": "ribosome", "session_id": "0", "is_multilabel": False, "user_id": "pytom"},
+            ],
+        )
+
+    with pytest.raises(ValueError):
+        copick_run.new_segmentations(
+            [
+                {"voxel_size": 10.0, "name": "ribosome", "session_id": "0", "is_multilabel": False, "user_id": "pytom"},
+                {
+                    "voxel_size": 20.0,
+                    "name": "membrane",
+                    "session_id": "0",
+                    "is_multilabel": False,
+                    "user_id": "membrain",
+                },
+            ],
+        )
+
+    assert len(copick_run.segmentations) == 3, "No segmentations should be added if the batch is invalid"
+
+    # Add two segmentations at once
+    segs = copick_run.new_segmentations(
+        [
+            {"voxel_size": 10.0, "name": "ribosome", "session_id": "0", "is_multilabel": False, "user_id": "pytom"},
+            {"voxel_size": 20.0, "name": "proteasome", "session_id": "0", "is_multilabel": False, "user_id": "pytom"},
+        ],
+    )
+    assert [s.name for s in segs] == ["ribosome", "proteasome"], "Incorrect segmentations returned"
+    assert all(s in copick_run.segmentations for s in segs), "Segmentations not added to segmentations"
+
+    # The zarr stores were created
+    copick_run.refresh_segmentations()
+    assert len(copick_run.segmentations) == 5, "Incorrect number of segmentations"
+    assert copick_run.has_segmentation("ribosome", "pytom", "0", 10.0, False), "Segmentation store not found"
+    assert copick_run.has_segmentation("proteasome", "pytom", "0", 20.0, False), "Segmentation store not found"
+
+
+def test_vs_new_tomograms_bulk(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+
+    # Duplicates within the batch or with existing tomograms raise an error before any tomogram is created
+    with pytest.raises(ValueError):
+        vs.new_tomograms([{"tomo_type": "imod"}, {"tomo_type": "imod"}])
+
+    with pytest.raises(ValueError):
+        vs.new_tomograms([{"tomo_type": "imod"}, {"tomo_type": "wbp"}])
+
+    assert len(vs.tomograms) == 2, "No tomograms should be added if the batch is invalid"
+
+    # Add two tomograms at once
+    tomos = vs.new_tomograms([{"tomo_type": "imod"}, {"tomo_type": "aretomo"}])
+    assert [t.tomo_type for t in tomos] == ["imod", "aretomo"], "Incorrect tomograms returned"
+    assert all(t in vs.tomograms for t in tomos), "Tomograms not added to tomograms"
+
+    # The zarr stores were created
+    vs.refresh_tomograms()
+    assert len(vs.tomograms) == 4, "Incorrect number of tomograms"
+    assert vs.get_tomogram("imod") is not None, "Tomogram store not found"
+    assert vs.get_tomogram("aretomo") is not None, "Tomogram store not found"
+
+
+def test_new_without_store(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+
+    # Tomogram store is created on the first call to zarr()
+    tomo = vs.new_tomogram(tomo_type="imod", create_store=False)
+    assert not tomo.fs_overlay.exists(tomo.overlay_path), "Tomogram store should not exist"
+    _ = tomo.zarr()
+    assert tomo.fs_overlay.exists(tomo.overlay_path), "Tomogram store should exist"
+
+    # Segmentation store is created on the first call to zarr()
+    seg = copick_run.new_segmentation(
+        voxel_size=10.0,
+        name="ribosome",
+        session_id="0",
+        is_multilabel=False,
+        user_id="pytom",
+        create_store=False,
+    )
+    assert not seg.fs.exists(seg.path), "Segmentation store should not exist"
+    _ = seg.zarr()
+    assert seg.fs.exists(seg.path), "Segmentation store should exist"
+
+
 def test_run_new_segmentations(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -690,6 +964,175 @@ def test_run_refresh(test_payload: Dict[str, Any]):
     assert len(copick_run.segmentations) == 3, "Incorrect number of segmentations"
 
 
+def test_run_get_duplicate_keys(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    if test_payload["testfs_static"] is None:
+        pytest.skip("Duplicate keys require a static and an overlay source.")
+
+    static_fs, static_loc = test_payload["testfs_static"], test_payload["testpath_static"]
+    overlay_fs, overlay_loc = test_payload["testfs_overlay"], test_payload["testpath_overlay"]
+
+    # Copy a static picks file to the overlay
+    name = "ExperimentRuns/TS_001/Picks/pytom_0_proteasome.json"
+    overlay_fs.makedirs(str(overlay_loc / "ExperimentRuns/TS_001/Picks"), exist_ok=True)
+    overlay_fs.pipe(str(overlay_loc / name), static_fs.cat(str(static_loc / name)))
+
+    # Fully keyed queries return the same picks as partial ones
+    full = copick_run.get_picks(object_name="proteasome", user_id="pytom", session_id="0")
+    partial = [p for p in copick_run.get_picks(object_name="proteasome", user_id="pytom") if p.session_id == "0"]
+    assert len(full) == 2, "Picks from both sources should be returned"
+    assert full == partial, "Fully keyed query should match partial query"
+    assert [p.read_only for p in full] == [True, False], "Incorrect sources"
+
+
+def test_run_refresh_keeps_created(test_payload: Dict[str, Any], monkeypatch):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    _ = copick_run.picks
+
+    # Create picks after the refresh listed the storage, but before it publishes the result
+    query_picks = type(copick_run).query_picks
+
+    def query_then_create(run):
+        listed = query_picks(run)
+        run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+        return listed
+
+    monkeypatch.setattr(type(copick_run), "query_picks", query_then_create)
+    copick_run.refresh_picks()
+    monkeypatch.undo()
+
+    assert copick_run.has_picks("ribosome", "ArtiaX", "0"), "Picks created during the refresh were dropped"
+    assert len(copick_run.picks) == 6, "Incorrect number of picks"
+    with pytest.raises(ValueError):
+        copick_run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+
+
+def test_run_refresh_during_store(test_payload: Dict[str, Any], monkeypatch):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    _ = copick_run.picks
+
+    # Refresh after new picks were added to the run, but before their file is written
+    store_picks = type(copick_run)._store_picks
+
+    def refresh_then_store(run, picks):
+        run.refresh_picks()
+        store_picks(run, picks)
+
+    monkeypatch.setattr(type(copick_run), "_store_picks", refresh_then_store)
+    copick_run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+    monkeypatch.undo()
+
+    assert copick_run.has_picks("ribosome", "ArtiaX", "0"), "Picks stored during the refresh were dropped"
+    with pytest.raises(ValueError):
+        copick_run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+
+    # A later refresh finds the stored file
+    copick_run.refresh_picks()
+    assert copick_run.has_picks("ribosome", "ArtiaX", "0"), "Stored picks were not found"
+    assert len(copick_run.picks) == 6, "Incorrect number of picks"
+
+
+def test_run_refresh_after_manifest(test_payload: Dict[str, Any], monkeypatch):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    _ = copick_run.picks
+
+    # Create picks after the run directory was listed, but before the child types are refreshed
+    query_manifest = type(copick_run)._query_manifest
+
+    def manifest_then_create(run):
+        manifest = query_manifest(run)
+        run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+        return manifest
+
+    monkeypatch.setattr(type(copick_run), "_query_manifest", manifest_then_create)
+    copick_run.refresh()
+    monkeypatch.undo()
+
+    assert copick_run.has_picks("ribosome", "ArtiaX", "0"), "Picks created after the listing were dropped"
+    assert len(copick_run.picks) == 6, "Incorrect number of picks"
+
+
+def test_run_pickle(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    copick_run.refresh()
+
+    # Runs and roots with materialized runs can be pickled
+    run = pickle.loads(pickle.dumps(copick_run))
+    assert run.name == "TS_001", "Incorrect run name"
+    assert len(run.picks) == len(copick_run.picks), "Incorrect number of picks"
+    assert run.get_voxel_spacing(10) is not None, "Voxel spacing not found"
+    run.new_picks(object_name="ribosome", session_id="0", user_id="ArtiaX")
+    assert run.has_picks("ribosome", "ArtiaX", "0"), "Picks not created on the unpickled run"
+
+    root = pickle.loads(pickle.dumps(copick_root))
+    assert root.get_run("TS_001") is not None, "Run not found"
+
+
+def test_run_query_symlinks(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    if test_payload["testfs_static"] is not None:
+        fs, loc = test_payload["testfs_static"], test_payload["testpath_static"]
+    else:
+        fs, loc = test_payload["testfs_overlay"], test_payload["testpath_overlay"]
+
+    if not isinstance(fs, LocalFileSystem):
+        pytest.skip("Symbolic links are only tested on local filesystems.")
+
+    # Replace a picks file and a segmentation with symbolic links to their moved originals
+    run_dir = Path(loc) / "ExperimentRuns" / "TS_001"
+    target_dir = Path(tempfile.mkdtemp())
+    for name in ["Picks/pytom_0_proteasome.json", "Segmentations/20.000_membrain_0_membrane.zarr"]:
+        target = target_dir / Path(name).name
+        shutil.move(str(run_dir / name), str(target))
+        os.symlink(target, run_dir / name)
+
+    # Linked entities are still found
+    assert len(copick_run.picks) == 5, "Incorrect number of picks"
+    assert len(copick_run.segmentations) == 3, "Incorrect number of segmentations"
+    assert copick_run.has_picks("proteasome", "pytom", "0"), "Linked picks not found"
+    assert copick_run.has_segmentation("membrane", "membrain", "0", 20.0, False), "Linked segmentation not found"
+
+    shutil.rmtree(target_dir)
+
+
+def test_run_refresh_async(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+
+    # Cached entities are kept until the background refresh completes
+    meshes = copick_run.meshes
+    done = threading.Event()
+    future = copick_run.refresh_async(on_done=lambda f: done.set())
+    future.result(timeout=60)
+
+    assert done.wait(timeout=60), "Callback not called"
+    assert copick_run._picks is not None, "Picks should be populated"
+    assert copick_run.meshes is not meshes, "Meshes should be replaced"
+    assert len(copick_run.meshes) == 3, "Incorrect number of meshes"
+
+    # Stale entities trigger a background refresh on access
+    copick_run.refresh_ttl = 0
+    first = copick_run._refresh_future
+    assert len(copick_run.meshes) == 3, "Incorrect number of meshes"
+    assert copick_run._refresh_future is not first, "No background refresh started"
+    copick_run._refresh_future.result(timeout=60)
+
+
 def test_vs_meta(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -734,6 +1177,37 @@ def test_vs_get_tomogram(test_payload: Dict[str, Any]):
     assert tomogram is None, "Tomogram should not be found"
 
 
+def test_vs_get_tomogram_both_sources(test_payload: Dict[str, Any]):
+    # Setup
+    if test_payload["testfs_static"] is None:
+        pytest.skip("Requires a static source.")
+    if not isinstance(test_payload["testfs_static"], LocalFileSystem) or not isinstance(
+        test_payload["testfs_overlay"],
+        LocalFileSystem,
+    ):
+        pytest.skip("Copying between sources is only tested on local filesystems.")
+
+    # Copy a tomogram and its features from the static to the overlay source
+    rel = Path("ExperimentRuns") / "TS_001" / "VoxelSpacing10.000"
+    for name in ["wbp.zarr", "wbp_sobel_features.zarr"]:
+        shutil.copytree(
+            Path(test_payload["testpath_static"]) / rel / name,
+            Path(test_payload["testpath_overlay"]) / rel / name,
+        )
+
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+
+    # The static (read-only) entities are found first
+    tomogram = vs.get_tomogram(tomo_type="wbp")
+    assert tomogram is not None, "Tomogram not found"
+    assert tomogram.read_only, "Tomogram should be read from the static source"
+    features = tomogram.get_features(feature_type="sobel")
+    assert features is not None, "Features not found"
+    assert features.read_only, "Features should be read from the static source"
+
+
 def test_vs_new_tomogram(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -968,6 +1442,12 @@ def test_tomogram_zarr(test_payload: Dict[str, Any]):
         abs=NUMERICAL_PRECISION,
     ), "Error reading Zarr (incorrect sum)."
 
+    # Check the store is opened once and reopened after invalidation
+    store = tomogram.zarr()
+    assert tomogram.zarr() is store, "Zarr store should be reused"
+    tomogram.invalidate_zarr()
+    assert tomogram.zarr() is not store, "Zarr store should be reopened"
+
     # Check zarr is writable
     tomo = vs.new_tomogram(tomo_type="test")
     zarr.array(np.random.rand(64, 64, 64), store=tomo.zarr(), chunks=(32, 32, 32))
@@ -1063,6 +1543,7 @@ def test_picks_meta(test_payload: Dict[str, Any]):
     assert pick.session_id == "0", "Incorrect session id"
     assert pick.user_id == "pytom", "Incorrect user id"
     assert pick.from_tool is True, "Incorrect from_tool"
+    assert pick.from_user is False, "Incorrect from_user"
     assert pick.trust_orientation is True, "Incorrect trust_orientation"
     assert pick.color == (255, 0, 0, 255), "Incorrect color"
 
@@ -1090,6 +1571,106 @@ def test_pick_io(test_payload: Dict[str, Any]):
     pck2 = copick_run.new_picks(object_name="ribosome", session_id="0", user_id="pytom")
     pck2.store()
 
+    # Check picks are written as 4-space indented JSON, keeping non-finite scores
+    pck2.points = [p.model_copy(update={"score": float("nan")}) for p in pck.points]
+    pck2.store()
+    with pck2.fs.open(pck2.path, "rb") as f:
+        raw = f.read()
+    assert raw == json.dumps(pck2.meta.model_dump(), indent=4).encode(), "Unexpected picks file contents"
+
+    pck2.load()
+    assert all(np.isnan(p.score) for p in pck2.points), "Non-finite scores not kept"
+    copick_run.refresh_picks()
+    pck3 = copick_run.get_picks(object_name="ribosome", session_id="0", user_id="pytom")[0]
+    assert np.all(np.isnan(pck3.numpy().scores)), "Non-finite scores not read into arrays"
+
+
+def test_point_transformation(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    point = copick_run.get_picks(object_name="proteasome", session_id="0", user_id="pytom")[0].points[0]
+
+    # Modifying the returned matrix does not change the point until it is set
+    t = point.transformation
+    t[:3, 3] += 1.0
+    assert not np.allclose(point.transformation, t), "Transformation changed without setting it"
+
+    point.transformation = t
+    assert np.allclose(point.transformation, t, atol=NUMERICAL_PRECISION), "Transformation not set"
+    assert np.allclose(point.transformation_, t, atol=NUMERICAL_PRECISION), "Serialized transformation not set"
+
+    # Assigning the field directly is reflected by the property, copies are independent
+    t[0, 3] = 5.0
+    point.transformation_ = t.tolist()
+    assert point.transformation[0, 3] == 5.0, "Transformation not updated from the field"
+
+    copy = point.model_copy()
+    copy.transformation = np.eye(4)
+    assert point.transformation[0, 3] == 5.0, "Transformation of the copy leaked into the original"
+    assert copy.transformation[0, 3] == 0.0, "Transformation of the copy not set"
+
+
+def test_pick_numpy(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    picks = copick_run.get_picks(object_name="proteasome", session_id="0", user_id="pytom")[0]
+
+    # Check unloaded points are read directly into arrays
+    arr_direct = picks.numpy()
+    assert picks.meta.points is None, "Points should not be loaded"
+
+    # Check struct-of-arrays matches the points
+    points = picks.points
+    arr = picks.numpy()
+    assert np.allclose(arr_direct.locations, arr.locations, atol=NUMERICAL_PRECISION), "Incorrect direct locations"
+    assert np.allclose(arr_direct.transforms, arr.transforms, atol=NUMERICAL_PRECISION), "Incorrect direct transforms"
+    assert np.array_equal(arr_direct.instance_ids, arr.instance_ids), "Incorrect direct instance_ids"
+    assert np.allclose(arr_direct.scores, arr.scores, atol=NUMERICAL_PRECISION), "Incorrect direct scores"
+    assert len(arr) == len(points), "Incorrect number of points"
+    assert arr.locations.shape == (len(points), 3), "Incorrect shape of locations"
+    assert arr.transforms.shape == (len(points), 4, 4), "Incorrect shape of transforms"
+
+    for p, q in zip(points, arr):
+        assert (q.location.x, q.location.y, q.location.z) == (p.location.x, p.location.y, p.location.z), "Bad location"
+        assert np.allclose(q.transformation, p.transformation, atol=NUMERICAL_PRECISION), "Bad transformation"
+        assert q.instance_id == p.instance_id, "Incorrect instance_id"
+        assert q.score == pytest.approx(p.score, abs=NUMERICAL_PRECISION), "Incorrect score"
+
+    # Check slicing and malformed input
+    assert len(arr[1:]) == len(arr) - 1, "Incorrect length of slice"
+    assert np.array_equal(arr[1:].locations, arr.locations[1:]), "Incorrect slice locations"
+    with pytest.raises(TypeError):
+        _ = arr["x"]
+    with pytest.raises(ValueError):
+        CopickPicksArray(locations=np.zeros((3, 4)))
+
+    # Check points do not share memory with the array
+    point = arr[0]
+    arr.transforms[0, 0, 3] += 1.0
+    assert np.allclose(point.transformation, point.transformation_, atol=NUMERICAL_PRECISION), "Point changed"
+    arr.transforms[0, 0, 3] -= 1.0
+
+    # Check null and omitted scores and instance IDs are read consistently with the points
+    dicts = [
+        {"location": {"x": 1.0, "y": 2.0, "z": 3.0}, "score": None, "instance_id": None},
+        {"location": {"x": 1.0, "y": 2.0, "z": 3.0}},
+    ]
+    from_dicts = CopickPicksArray.from_dicts(dicts)
+    from_points = CopickPicksArray.from_points([CopickPoint.model_validate(d) for d in dicts])
+    for a in [from_dicts, from_points]:
+        assert np.isnan(a.scores[0]), "Null score should be NaN"
+        assert a.scores[1] == 1.0, "Omitted score should be the default"
+        assert np.all(a.instance_ids == 0), "Null and omitted instance IDs should be 0"
+
+    # Check points can be set and stored from arrays
+    pck2 = copick_run.new_picks(object_name="ribosome", session_id="0", user_id="pytom")
+    pck2.from_numpy(arr)
+    pck2.store()
+    pck2.load()
+    assert np.allclose(pck2.numpy().locations, arr.locations, atol=NUMERICAL_PRECISION), "Incorrect stored locations"
+
 
 def test_repr(test_payload: Dict[str, Any]):
     # Setup